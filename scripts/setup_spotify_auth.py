@@ -6,6 +6,7 @@ It should be run on the host machine (not inside Docker).
 """
 
 import os
+import re
 import sys
 import time
 import base64
@@ -13,15 +14,60 @@ import webbrowser
 import sqlite3
 from http.server import HTTPServer, BaseHTTPRequestHandler
 from urllib.parse import urlparse, parse_qs
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     print("ERROR: requests library not found. Install it with: pip install requests")
     sys.exit(1)
 
 
+def _create_session() -> requests.Session:
+    """Create a keep-alive session for Spotify API calls.
+
+    Connection errors and 502/503/504 responses are retried with backoff.
+    POSTs are only retried when the request never reached the server, since
+    an authorization code can only be exchanged once.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": "jambot/1.0"})
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+# KEY=value lines, with optional quotes and trailing # comment
+_ENV_LINE_RE = re.compile(
+    r"""^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*"""
+    r"""(?:"([^"\n]*)"|'([^'\n]*)'|([^#\n]*?))[ \t]*(?:#.*)?$""",
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=None)
+def load_env_file(env_file: Path) -> dict:
+    """Parse a .env file into a dict, once per path."""
+    values = {}
+    for match in _ENV_LINE_RE.finditer(env_file.read_text()):
+        key, double_quoted, single_quoted, bare = match.groups()
+        if double_quoted is not None:
+            values[key] = double_quoted
+        elif single_quoted is not None:
+            values[key] = single_quoted
+        else:
+            values[key] = bare
+    return values
+
+
 # Load config from .env file
 class Config:
     """Minimal config loader for Spotify credentials."""
@@ -35,23 +81,7 @@ class Config:
             )
 
         # Load environment variables
-        with open(env_file) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith("#") and "=" in line:
-                    # Split on first = only
-                    key, value = line.split("=", 1)
-                    # Strip whitespace and handle inline comments
-                    value = value.strip()
-                    # Remove inline comments (anything after #)
-                    if "#" in value:
-                        value = value.split("#")[0].strip()
-                    # Remove quotes if present
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    os.environ[key] = value
+        os.environ.update(load_env_file(env_file))
 
         # Get required values
         self.SPOTIFY_CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID", "")
@@ -135,41 +165,56 @@ def exchange_code_for_tokens(auth_code: str, config) -> dict:
         "redirect_uri": config.SPOTIFY_REDIRECT_URI,
     }
 
-    response = requests.post(token_url, headers=headers, data=data, timeout=10)
+    response = _SESSION.post(token_url, headers=headers, data=data, timeout=10)
     response.raise_for_status()
 
     return response.json()
 
 
-def save_tokens_to_db(access_token: str, refresh_token: str, expires_in: int, db_path: str):
-    """Save tokens to the database."""
+TOKENS_TABLE_DDL = """
+    CREATE TABLE IF NOT EXISTS spotify_tokens (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        access_token TEXT NOT NULL,
+        refresh_token TEXT NOT NULL,
+        expires_at INTEGER NOT NULL,
+        created_at INTEGER DEFAULT (strftime('%s', 'now')),
+        updated_at INTEGER DEFAULT (strftime('%s', 'now'))
+    )
+"""
+
+
+def init_tokens_db(db_path: str):
+    """Create the database directory and spotify_tokens table if needed."""
     db_dir = Path(db_path).parent
     db_dir.mkdir(parents=True, exist_ok=True)
 
-    expires_at = int(time.time()) + expires_in
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        # WAL is persistent for the database file, so it only needs setting once here
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(TOKENS_TABLE_DDL)
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("""
-        CREATE TABLE IF NOT EXISTS spotify_tokens (
-            id INTEGER PRIMARY KEY CHECK (id = 1),
-            access_token TEXT NOT NULL,
-            refresh_token TEXT NOT NULL,
-            expires_at INTEGER NOT NULL,
-            created_at INTEGER DEFAULT (strftime('%s', 'now')),
-            updated_at INTEGER DEFAULT (strftime('%s', 'now'))
-        )
-    """)
 
-    cursor.execute("""
-        INSERT OR REPLACE INTO spotify_tokens
-        (id, access_token, refresh_token, expires_at, updated_at)
-        VALUES (1, ?, ?, ?, strftime('%s', 'now'))
-    """, (access_token, refresh_token, expires_at))
+def save_tokens_to_db(access_token: str, refresh_token: str, expires_in: int, db_path: str):
+    """Save tokens to the database.
+
+    The spotify_tokens table must already exist (see init_tokens_db).
+    """
+    expires_at = int(time.time()) + expires_in
 
-    conn.commit()
-    conn.close()
+    # closing() releases the file handle; the inner "with conn" commits or rolls back
+    with closing(sqlite3.connect(db_path)) as conn, conn:
+        # One fsync per commit is plenty for a token the user can re-authorize
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("""
+            INSERT INTO spotify_tokens
+            (id, access_token, refresh_token, expires_at, updated_at)
+            VALUES (1, ?, ?, ?, strftime('%s', 'now'))
+            ON CONFLICT(id) DO UPDATE SET
+                access_token = excluded.access_token,
+                refresh_token = excluded.refresh_token,
+                expires_at = excluded.expires_at,
+                updated_at = excluded.updated_at
+        """, (access_token, refresh_token, expires_at))
 
     print(f"✓ Tokens saved to database: {db_path}")
 
@@ -250,6 +295,7 @@ def main():
 
     print("Step 4: Saving tokens to database...")
     try:
+        init_tokens_db(config.DATABASE_PATH)
         save_tokens_to_db(
             tokens['access_token'],
             tokens['refresh_token'],
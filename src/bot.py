@@ -3,6 +3,10 @@ import discord
 from discord.ext import commands, tasks
 from typing import Optional, List, Dict, Any, Tuple
 import asyncio
+import functools
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from src.config import Config
 from src.logger import logger
 from src.database import Database
@@ -12,6 +16,23 @@ from src.commands import JambotCommands
 from src.chart_commands import ChartCommands
 from src.rate_limiter import RateLimiter
 
+# Spotify track link in a DM reply; Discord's <...> link suppression is excluded
+_SPOTIFY_TRACK_URL_RE = re.compile(r'(?:https?://)?(?:open\.)?spotify\.com/track/[A-Za-z0-9]+')
+
+
+def _parse_user_id(value: Optional[str]) -> Optional[int]:
+    """Parse a Discord user ID from a config string.
+
+    Args:
+        value: Config value, e.g. Config.DISCORD_ADMIN_ID.
+
+    Returns:
+        The ID as an int, or None if unset or not numeric.
+    """
+    if value and value.strip().isdigit():
+        return int(value)
+    return None
+
 
 class JamBot(commands.Bot):
     """Discord bot for managing bluegrass jam setlists and Spotify playlists."""
@@ -20,6 +41,22 @@ class JamBot(commands.Bot):
     APPROVE_EMOJI = "✅"
     REJECT_EMOJI = "❌"
     SELECT_EMOJIS = ["1️⃣", "2️⃣", "3️⃣"]
+    SELECT_EMOJI_INDEX: Dict[str, int] = {emoji: i for i, emoji in enumerate(SELECT_EMOJIS)}
+
+    # Max concurrent song lookups per setlist (bounds Spotify API load)
+    SONG_LOOKUP_CONCURRENCY = 5
+
+    # Threads shared by all blocking Spotify HTTP calls (bounds load across guilds)
+    SPOTIFY_EXECUTOR_WORKERS = 8
+
+    # Max concurrent DMs per notify_admin fan-out
+    NOTIFY_CONCURRENCY = 5
+
+    # Notification DMs are paced by a token bucket to stay clear of Discord 429s
+    NOTIFY_RATE = 5.0  # messages per second, also the burst size
+
+    # Guild configuration is cached so approval -> playlist creation skips the DB
+    GUILD_CONFIG_CACHE_TTL = 300  # seconds
 
     def __init__(self):
         """Initialize the jam bot."""
@@ -33,6 +70,15 @@ class JamBot(commands.Bot):
         self.db = Database()
         self._default_parser = SetlistParser()
         self._guild_parsers: Dict[int, SetlistParser] = {}  # Cache guild-specific parsers
+        self._spotify_clients: Dict[int, SpotifyClient] = {}  # Cache authenticated clients per guild
+        self._spotify_executor = ThreadPoolExecutor(
+            max_workers=self.SPOTIFY_EXECUTOR_WORKERS, thread_name_prefix='spotify'
+        )
+        self._guild_config_cache: Dict[int, Tuple[float, Optional[Dict]]] = {}  # guild -> (expires, config)
+        self.db.on_premium_change = self.invalidate_guild_config_cache  # Premium status is read from this cache
+        self._notify_semaphore = asyncio.Semaphore(self.NOTIFY_CONCURRENCY)
+        self._dm_tokens = self.NOTIFY_RATE
+        self._dm_tokens_updated = time.monotonic()
 
         # Initialize rate limiter (will connect in setup_hook)
         self.rate_limiter = None
@@ -49,6 +95,10 @@ class JamBot(commands.Bot):
         # Track active approval workflows
         self.active_workflows: Dict[int, Dict] = {}  # message_id -> workflow data
 
+        # Legacy env var fallbacks, parsed once instead of on every message
+        self._fallback_admin_id = _parse_user_id(Config.DISCORD_ADMIN_ID)
+        self._fallback_jam_leader_id = _parse_user_id(Config.DISCORD_JAM_LEADER_ID)
+
         logger.info("JamBot initialized")
 
     def is_workflow_ready(self, workflow: Dict) -> Tuple[bool, List[str]]:
@@ -83,6 +133,7 @@ class JamBot(commands.Bot):
 
             logger.info(f"Found {len(expired)} expired workflows to clean up")
 
+            finished = []
             for workflow in expired:
                 try:
                     # Update status to expired
@@ -103,10 +154,7 @@ class JamBot(commands.Bot):
                             guild_id=guild_id
                         )
 
-                    # Cleanup from active workflows
-                    self.cleanup_workflow(workflow)
-
-                    logger.info(f"Cleaned up expired workflow {workflow['id']}")
+                    finished.append(workflow)
 
                 except Exception as e:
                     logger.error(
@@ -114,6 +162,9 @@ class JamBot(commands.Bot):
                         exc_info=True
                     )
 
+            # Cleanup from active workflows in one pass
+            self.cleanup_workflows(finished)
+
         except Exception as e:
             logger.error(f"Error in cleanup_expired_workflows task: {e}", exc_info=True)
 
@@ -131,7 +182,7 @@ class JamBot(commands.Bot):
         Returns:
             SetlistParser configured with guild's custom patterns or defaults.
         """
-        # Check cache first
+        # Check cache first (guilds without custom patterns cache the default parser)
         if guild_id in self._guild_parsers:
             return self._guild_parsers[guild_id]
 
@@ -151,6 +202,7 @@ class JamBot(commands.Bot):
             return parser
 
         # Otherwise use default parser
+        self._guild_parsers[guild_id] = self._default_parser
         return self._default_parser
 
     def invalidate_parser_cache(self, guild_id: int):
@@ -163,6 +215,125 @@ class JamBot(commands.Bot):
             del self._guild_parsers[guild_id]
             logger.info(f"Invalidated parser cache for guild {guild_id}")
 
+    def is_jam_leader(self, guild_id: int, user_id: int) -> bool:
+        """Check if a user is a jam leader from the cached guild configuration.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+            user_id: Discord user ID to check.
+
+        Returns:
+            True if user is a jam leader, False otherwise.
+        """
+        config = self.get_guild_config(guild_id)
+        return bool(config and user_id in config['jam_leader_ids'])
+
+    def get_guild_config(self, guild_id: int) -> Optional[Dict]:
+        """Get a guild's bot configuration, using a short-lived cache.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+
+        Returns:
+            Configuration dictionary, or None if the guild isn't configured.
+        """
+        now = time.monotonic()
+        cached = self._guild_config_cache.get(guild_id)
+        if cached and cached[0] > now:
+            return cached[1]
+
+        config = self.db.get_bot_configuration(guild_id)
+        self._guild_config_cache[guild_id] = (now + self.GUILD_CONFIG_CACHE_TTL, config)
+        return config
+
+    def get_approver_ids(self, guild_id: int) -> List[int]:
+        """Get a guild's approver IDs from the cached guild configuration.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+
+        Returns:
+            List of approver user IDs, or empty list if not configured.
+        """
+        config = self.get_guild_config(guild_id)
+        return config['approver_ids'] if config else []
+
+    def is_premium_enabled(self, guild_id: int) -> bool:
+        """Check premium status from the cached guild configuration.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+
+        Returns:
+            True if premium is enabled and a token is configured, False otherwise.
+        """
+        config = self.get_guild_config(guild_id)
+        return bool(config and config.get('premium_enabled') and config.get('premium_api_token'))
+
+    def invalidate_guild_config_cache(self, guild_id: int):
+        """Invalidate the cached configuration for a guild (after settings update).
+
+        Args:
+            guild_id: Discord guild (server) ID.
+        """
+        if self._guild_config_cache.pop(guild_id, None):
+            logger.info(f"Invalidated configuration cache for guild {guild_id}")
+
+    def get_spotify_for_guild(self, guild_id: int) -> SpotifyClient:
+        """Get an authenticated Spotify client for a guild, reusing a cached one.
+
+        A cached client is reused until its access token is about to expire or
+        the stored tokens change (e.g. the guild re-authorized through the web
+        OAuth flow, which runs outside the bot). Building a client authenticates
+        over the network, so call this via _run_spotify from async code.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+
+        Returns:
+            SpotifyClient for the guild.
+        """
+        spotify = self._spotify_clients.get(guild_id)
+        if (
+            spotify
+            and spotify.is_session_valid()
+            and self.db.get_spotify_access_token(guild_id) == spotify.access_token
+        ):
+            return spotify
+
+        spotify = SpotifyClient(db=self.db, guild_id=guild_id)
+        # Only cache working clients so a fixed configuration is picked up right away
+        if spotify.sp is not None:
+            self._spotify_clients[guild_id] = spotify
+        else:
+            self._spotify_clients.pop(guild_id, None)
+        return spotify
+
+    async def _run_spotify(self, func, *args, **kwargs):
+        """Run a blocking Spotify call on the shared Spotify thread pool.
+
+        Args:
+            func: Blocking callable (SpotifyClient method or constructor helper).
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The result of func.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._spotify_executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def invalidate_spotify_cache(self, guild_id: int):
+        """Invalidate the cached Spotify client for a guild (after credential update).
+
+        Args:
+            guild_id: Discord guild (server) ID.
+        """
+        if self._spotify_clients.pop(guild_id, None):
+            logger.info(f"Invalidated Spotify client cache for guild {guild_id}")
+
     @property
     def parser(self) -> SetlistParser:
         """Default parser property for backwards compatibility."""
@@ -210,10 +381,7 @@ class JamBot(commands.Bot):
         try:
             workflows = self.db.get_all_active_workflows()
             for workflow in workflows:
-                summary_msg_id = workflow['summary_message_id']
-                # Populate active_workflows dict for all message IDs
-                for msg_id in workflow['message_ids'] + [summary_msg_id]:
-                    self.active_workflows[msg_id] = workflow
+                self.register_workflow(workflow)
             logger.info(f"Restored {len(workflows)} active workflows from database")
         except Exception as e:
             logger.error(f"Failed to restore workflows from database: {e}", exc_info=True)
@@ -226,6 +394,9 @@ class JamBot(commands.Bot):
         if self.rate_limiter:
             await self.rate_limiter.close()
 
+        # Don't wait on in-flight Spotify calls; their results are no longer needed
+        self._spotify_executor.shutdown(wait=False)
+
         # Close parent bot connection
         await super().close()
         logger.info("Bot closed and cleaned up resources")
@@ -256,23 +427,24 @@ class JamBot(commands.Bot):
             await self.handle_dm_message(message)
             return
 
-        # Log all messages for debugging
-        logger.info(f"Received message from {message.author} (ID: {message.author.id})")
-        logger.info(f"Message content preview: {message.content[:100]}...")
+        # Log all messages for debugging (lazy args: runs on every guild message)
+        logger.debug("Received message from %s (ID: %s)", message.author, message.author.id)
+        logger.debug("Message content preview: %.100s...", message.content)
 
-        # Get guild-specific parser (with custom patterns if configured)
-        parser = self.get_parser_for_guild(message.guild.id)
-
-        # Check if message is from a jam leader
-        if self.db.is_jam_leader(message.guild.id, message.author.id):
-            if parser.is_setlist_message(message.content):
-                logger.info(f"Detected setlist message from jam leader in channel {message.channel.id}")
-                await self.handle_setlist_message(message)
+        # Check if message is from a jam leader; the env var fallback (int compare)
+        # is kept for backwards compatibility during migration
+        if self._fallback_jam_leader_id and message.author.id == self._fallback_jam_leader_id:
+            leader_source = "env var"
+        elif self.is_jam_leader(message.guild.id, message.author.id):
+            leader_source = "database"
+        else:
+            leader_source = None
 
-        # Also fall back to env var for backwards compatibility during migration
-        elif Config.DISCORD_JAM_LEADER_ID and str(message.author.id) == Config.DISCORD_JAM_LEADER_ID:
+        # Only jam leaders' messages need the guild parser and setlist regex
+        if leader_source:
+            parser = self.get_parser_for_guild(message.guild.id)
             if parser.is_setlist_message(message.content):
-                logger.info(f"Detected setlist message from jam leader (env var) in channel {message.channel.id}")
+                logger.info(f"Detected setlist message from jam leader ({leader_source}) in channel {message.channel.id}")
                 await self.handle_setlist_message(message)
 
         # Handle @mention chord chart requests (user mention or "jambot" role mention)
@@ -296,47 +468,31 @@ class JamBot(commands.Bot):
             message: Discord DM message object.
         """
         try:
-            logger.info(f"Received DM from {message.author} (ID: {message.author.id})")
-            logger.info(f"DM content: {message.content[:200]}")
+            logger.debug("Received DM from %s (ID: %s)", message.author, message.author.id)
+            logger.debug("DM content: %.200s", message.content)
 
             # Check if message is a reply to one of our embeds
             if not message.reference or not message.reference.message_id:
-                logger.info("DM is not a reply to another message")
+                logger.debug("DM is not a reply to another message")
                 return
 
             replied_msg_id = message.reference.message_id
-            logger.info(f"DM is a reply to message ID: {replied_msg_id}")
-
-            # Find which workflow this message belongs to
-            workflow_id = None
-            song_number = None
-
-            logger.info(f"Searching through {len(self.active_workflows)} active workflows")
-            for wf_id, workflow in self.active_workflows.items():
-                logger.info(f"  Workflow {wf_id} has {len(workflow['message_ids'])} messages")
-                if replied_msg_id in workflow['message_ids']:
-                    workflow_id = wf_id
-                    # Find which song this message corresponds to
-                    msg_index = workflow['message_ids'].index(replied_msg_id)
-                    if msg_index < len(workflow['song_matches']):
-                        song_number = workflow['song_matches'][msg_index]['number']
-                    logger.info(f"Found workflow {wf_id} for song {song_number}")
-                    break
-
-            if not workflow_id or song_number is None:
-                logger.info(f"DM reply not associated with any active workflow")
-                logger.info(f"  Replied message ID: {replied_msg_id}")
-                logger.info(f"  Active workflow IDs: {list(self.active_workflows.keys())}")
+            logger.debug("DM is a reply to message ID: %s", replied_msg_id)
+
+            # active_workflows is keyed by every song message ID, so the workflow
+            # and the song this message corresponds to are direct lookups
+            workflow = self.active_workflows.get(replied_msg_id)
+            match = self._get_message_match(workflow, replied_msg_id) if workflow else None
+            if match is None:
+                logger.debug("DM reply to message %s not associated with any active workflow", replied_msg_id)
                 return
 
-            # Parse Spotify URL from message content
-            spotify_url = None
-            for word in message.content.split():
-                if 'spotify.com/track/' in word or 'open.spotify.com/track/' in word:
-                    spotify_url = word.strip('<>')  # Remove Discord's angle brackets
-                    break
+            song_number = match['number']
+            logger.debug("Found workflow for song %s", song_number)
 
-            if not spotify_url:
+            # Parse Spotify URL from message content
+            url_match = _SPOTIFY_TRACK_URL_RE.search(message.content)
+            if not url_match:
                 await message.reply(
                     "❌ Please provide a Spotify track URL.\n"
                     "Example: `https://open.spotify.com/track/...`"
@@ -344,15 +500,15 @@ class JamBot(commands.Bot):
                 return
 
             # Validate and get track info
+            spotify_url = url_match.group(0)
             logger.info(f"User provided manual Spotify URL for song {song_number}: {spotify_url}")
 
             # Get guild_id from workflow
-            workflow = self.active_workflows[workflow_id]
             guild_id = workflow.get('guild_id', 0)
 
-            # Create Spotify client for this guild
-            spotify = SpotifyClient(guild_id=guild_id)
-            track_info = spotify.get_track_from_url(spotify_url)
+            # Get Spotify client for this guild
+            spotify = await self._run_spotify(self.get_spotify_for_guild, guild_id)
+            track_info = await self._run_spotify(spotify.get_track_from_url, spotify_url)
 
             if not track_info:
                 await message.reply(
@@ -362,13 +518,8 @@ class JamBot(commands.Bot):
                 return
 
             # Persist song to database immediately
-            workflow = self.active_workflows[workflow_id]
-            song_title = None
-            for match in workflow["song_matches"]:
-                if match["number"] == song_number:
-                    song_title = match.get("title") or match.get("name")
-                    break
-            
+            song_title = match.get("title") or match.get("name")
+
             try:
                 self.db.add_or_update_song(
                     guild_id=guild_id,
@@ -473,46 +624,49 @@ class JamBot(commands.Bot):
         Returns:
             List of match dictionaries with song info and Spotify results.
         """
-        matches = []
+        # Get Spotify client for this guild (authenticates over the network on a cache miss)
+        spotify = await self._run_spotify(self.get_spotify_for_guild, guild_id)
+        semaphore = asyncio.Semaphore(self.SONG_LOOKUP_CONCURRENCY)
 
-        # Create Spotify client for this guild
-        spotify = SpotifyClient(guild_id=guild_id)
+        # Check database first (guild-scoped), one query for the whole setlist
+        stored_songs = await asyncio.to_thread(
+            self.db.get_songs_by_titles, guild_id, [song['title'] for song in songs]
+        )
 
-        for song in songs:
+        async def match_song(song: Dict) -> Dict[str, Any]:
             song_title = song['title']
-            logger.info(f"Searching for song in guild {guild_id}: {song_title}")
+            async with semaphore:
+                logger.info(f"Searching for song in guild {guild_id}: {song_title}")
+
+                db_song = stored_songs.get(song_title)
+                if db_song:
+                    logger.info(f"Found stored version for: {song_title}")
+                    return {
+                        'number': song['number'],
+                        'title': song_title,
+                        'stored_version': {
+                            'id': db_song['spotify_track_id'],
+                            'name': db_song['spotify_track_name'],
+                            'artist': db_song['artist'],
+                            'album': db_song['album'],
+                            'url': db_song['spotify_url'],
+                            'uri': f"spotify:track:{db_song['spotify_track_id']}",
+                        },
+                        'spotify_results': [],
+                    }
 
-            # Check database first (guild-scoped)
-            db_song = self.db.get_song_by_title(guild_id, song_title)
-            if db_song:
-                logger.info(f"Found stored version for: {song_title}")
-                match = {
-                    'number': song['number'],
-                    'title': song_title,
-                    'stored_version': {
-                        'id': db_song['spotify_track_id'],
-                        'name': db_song['spotify_track_name'],
-                        'artist': db_song['artist'],
-                        'album': db_song['album'],
-                        'url': db_song['spotify_url'],
-                        'uri': f"spotify:track:{db_song['spotify_track_id']}",
-                    },
-                    'spotify_results': [],
-                }
-            else:
                 # Search Spotify
-                spotify_results = spotify.search_song(song_title, limit=3)
+                spotify_results = await self._run_spotify(spotify.search_song, song_title, limit=3)
                 logger.info(f"Spotify search returned {len(spotify_results)} results")
-                match = {
+                return {
                     'number': song['number'],
                     'title': song_title,
                     'stored_version': None,
                     'spotify_results': spotify_results,
                 }
 
-            matches.append(match)
-
-        return matches
+        # Songs are independent, so look them up concurrently (order is preserved)
+        return list(await asyncio.gather(*(match_song(song) for song in songs)))
 
     async def send_approval_workflow(
         self,
@@ -533,19 +687,23 @@ class JamBot(commands.Bot):
         """
         try:
 
-            # Get approver IDs from database
-            approver_ids = self.db.get_approver_ids(guild_id)
-            logger.info(f"Approver IDs from database for guild {guild_id}: {approver_ids}")
+            # Get approver IDs from the cached guild configuration; this also warms
+            # the config cache that playlist creation reads once the workflow is approved
+            approver_ids = self.get_approver_ids(guild_id)
+            logger.info(f"Approver IDs for guild {guild_id}: {approver_ids}")
 
             # Fall back to env var if no approvers configured
-            if not approver_ids and Config.DISCORD_ADMIN_ID:
-                approver_ids = [int(Config.DISCORD_ADMIN_ID)]
+            if not approver_ids and self._fallback_admin_id:
+                approver_ids = [self._fallback_admin_id]
                 logger.info("Using fallback admin from environment variable")
 
-            # If triggered manually, ensure that user also gets the workflow
-            if triggered_by_user_id and triggered_by_user_id not in approver_ids:
-                approver_ids = list(approver_ids) + [triggered_by_user_id]
+            # If triggered manually, ensure that user also gets the workflow. Dict keys
+            # give O(1) membership and drop duplicates while keeping the configured order.
+            recipients = dict.fromkeys(approver_ids)
+            if triggered_by_user_id and triggered_by_user_id not in recipients:
+                recipients[triggered_by_user_id] = None
                 logger.info(f"Added triggering user {triggered_by_user_id} to approver list")
+            approver_ids = list(recipients)
 
             if not approver_ids:
                 logger.error(
@@ -556,18 +714,27 @@ class JamBot(commands.Bot):
 
             logger.info(f"Sending approval workflow to {len(approver_ids)} user(s): {approver_ids}")
 
-            # Send workflow to all approvers
-            for approver_id in approver_ids:
-                try:
-                    await self._send_approval_workflow_to_user(
-                        approver_id,
-                        setlist_data,
-                        song_matches,
-                        original_channel_id,
-                        guild_id
+            # Embeds are never mutated once sent, so build them once for all approvers
+            song_embeds = [self.create_song_approval_embed(match) for match in song_matches]
+
+            # Send workflow to all approvers concurrently; one failure doesn't block the others
+            results = await asyncio.gather(*(
+                self._send_approval_workflow_to_user(
+                    approver_id,
+                    setlist_data,
+                    song_matches,
+                    original_channel_id,
+                    guild_id,
+                    song_embeds=song_embeds
+                )
+                for approver_id in approver_ids
+            ), return_exceptions=True)
+            for approver_id, result in zip(approver_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(
+                        f"Failed to send approval workflow to user {approver_id}: {result}",
+                        exc_info=result
                     )
-                except Exception as e:
-                    logger.error(f"Failed to send approval workflow to user {approver_id}: {e}", exc_info=True)
 
         except Exception as e:
             logger.error(f"Error sending approval workflow: {e}", exc_info=True)
@@ -578,7 +745,8 @@ class JamBot(commands.Bot):
         setlist_data: Dict,
         song_matches: List[Dict],
         original_channel_id: int,
-        guild_id: int = 0
+        guild_id: int = 0,
+        song_embeds: Optional[List[discord.Embed]] = None
     ):
         """Send approval workflow DM to a specific user.
 
@@ -588,9 +756,10 @@ class JamBot(commands.Bot):
             song_matches: List of song matches from database/Spotify.
             original_channel_id: ID of channel where setlist was posted.
             guild_id: Discord guild (server) ID.
+            song_embeds: Prebuilt approval embeds, one per song match (built if omitted).
         """
         # Get user
-        user = await self.fetch_user(user_id)
+        user = await self._get_user(user_id)
         if not user:
             logger.error(
                 f"Could not find user {user_id}. "
@@ -599,15 +768,11 @@ class JamBot(commands.Bot):
             )
             return
 
-        # Create DM channel
-        dm_channel = await user.create_dm()
+        # Reuse the cached DM channel if there is one
+        dm_channel = user.dm_channel or await user.create_dm()
 
-        # Build approval message
-        embed = discord.Embed(
-            title=f"🎵 Setlist Approval: {setlist_data['time']} jam on {setlist_data['date']}",
-            description="Please review and approve the song selections below.",
-            color=discord.Color.blue()
-        )
+        if song_embeds is None:
+            song_embeds = [self.create_song_approval_embed(match) for match in song_matches]
 
         # Track selections for this workflow
         workflow_data = {
@@ -617,45 +782,57 @@ class JamBot(commands.Bot):
             'guild_id': guild_id,  # Store guild_id for DM handlers
             'selections': {},  # song_number -> track_info
             'message_ids': [],  # DM message IDs for reaction tracking
+            'message_to_match': {},  # DM message ID -> song match (in-memory only)
         }
 
-        # Send song-by-song for approval
-        for match in song_matches:
-            song_embed = await self.create_song_approval_embed(match)
-            msg = await dm_channel.send(embed=song_embed)
-            workflow_data['message_ids'].append(msg.id)
-
-            # Add reaction emojis based on options
-            if match['stored_version']:
-                # Pre-approved version - just add checkmark
-                await msg.add_reaction(self.APPROVE_EMOJI)
-                # Auto-select stored version
-                workflow_data['selections'][match['number']] = match['stored_version']
-            elif len(match['spotify_results']) == 0:
-                # No matches - add X emoji
-                await msg.add_reaction(self.REJECT_EMOJI)
-            elif len(match['spotify_results']) == 1:
-                # Single match - add checkmark to confirm
-                await msg.add_reaction(self.APPROVE_EMOJI)
-                # Auto-select the single result
-                workflow_data['selections'][match['number']] = match['spotify_results'][0]
-            else:
-                # Multiple matches - add number emojis
-                for i in range(min(len(match['spotify_results']), 3)):
-                    await msg.add_reaction(self.SELECT_EMOJIS[i])
+        # Send song-by-song for approval. Embeds go out in order so the DM reads
+        # like the setlist; each message's reactions start in the background as
+        # soon as it is sent, overlapping with the remaining sends.
+        reaction_tasks = []
+        try:
+            for match, song_embed in zip(song_matches, song_embeds):
+                msg = await dm_channel.send(embed=song_embed)
+                workflow_data['message_ids'].append(msg.id)
+                workflow_data['message_to_match'][msg.id] = match
+
+                # Add reaction emojis based on options
+                if match['stored_version']:
+                    # Pre-approved version - just add checkmark
+                    emojis = [self.APPROVE_EMOJI]
+                    # Auto-select stored version
+                    workflow_data['selections'][match['number']] = match['stored_version']
+                elif len(match['spotify_results']) == 0:
+                    # No matches - add X emoji
+                    emojis = [self.REJECT_EMOJI]
+                elif len(match['spotify_results']) == 1:
+                    # Single match - add checkmark to confirm
+                    emojis = [self.APPROVE_EMOJI]
+                    # Auto-select the single result
+                    workflow_data['selections'][match['number']] = match['spotify_results'][0]
+                else:
+                    # Multiple matches - add number emojis
+                    emojis = self.SELECT_EMOJIS[:len(match['spotify_results'])]
+                reaction_tasks.append(asyncio.create_task(self._add_reactions(msg, emojis)))
 
-        # Send summary and final approval message
-        summary_msg = await dm_channel.send(
-            "✅ **Review complete! React with ✅ to create the playlist or ❌ to cancel.**"
-        )
-        await summary_msg.add_reaction(self.APPROVE_EMOJI)
-        await summary_msg.add_reaction(self.REJECT_EMOJI)
+            # Send summary and final approval message
+            summary_msg = await dm_channel.send(
+                "✅ **Review complete! React with ✅ to create the playlist or ❌ to cancel.**"
+            )
+            reaction_tasks.append(asyncio.create_task(
+                self._add_reactions(summary_msg, [self.APPROVE_EMOJI, self.REJECT_EMOJI])
+            ))
+        finally:
+            # Always collect started reaction tasks, even if a later send failed, so
+            # none are orphaned. A failed reaction shouldn't lose the workflow;
+            # users can still react manually.
+            for result in await asyncio.gather(*reaction_tasks, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to add approval reactions for user {user_id}: {result}")
 
         workflow_data['summary_message_id'] = summary_msg.id
 
         # Store workflow data
-        for msg_id in workflow_data['message_ids'] + [summary_msg.id]:
-            self.active_workflows[msg_id] = workflow_data
+        self.register_workflow(workflow_data)
 
         # Persist to database
         try:
@@ -667,7 +844,64 @@ class JamBot(commands.Bot):
 
         logger.info(f"Sent approval workflow to user {user_id} for {len(song_matches)} songs")
 
-    async def create_song_approval_embed(self, match: Dict) -> discord.Embed:
+    @staticmethod
+    def _get_message_match(workflow: Dict, message_id: int) -> Optional[Dict]:
+        """Get the song match for a workflow DM message.
+
+        Uses the workflow's message_to_match index, building it on first use for
+        workflows restored from the database (which don't persist the index).
+
+        Args:
+            workflow: Workflow data dictionary.
+            message_id: Discord message ID of a song approval DM.
+
+        Returns:
+            The song match dict, or None if the message isn't a song message.
+        """
+        message_to_match = workflow.get('message_to_match')
+        if message_to_match is None:
+            message_to_match = dict(zip(workflow['message_ids'], workflow['song_matches']))
+            workflow['message_to_match'] = message_to_match
+        return message_to_match.get(message_id)
+
+    async def _get_user(self, user_id: int) -> Optional[discord.User]:
+        """Get a user from the client cache, fetching from the API on a miss.
+
+        Args:
+            user_id: Discord user ID.
+
+        Returns:
+            The Discord user.
+        """
+        return self.get_user(user_id) or await self.fetch_user(user_id)
+
+    async def _get_dm_channel(self, user_id: int) -> discord.DMChannel:
+        """Get the DM channel for a user, creating it only if not cached.
+
+        Args:
+            user_id: Discord user ID.
+
+        Returns:
+            The user's DM channel.
+        """
+        user = await self._get_user(user_id)
+        return user.dm_channel or await user.create_dm()
+
+    @staticmethod
+    async def _add_reactions(message: discord.Message, emojis: List[str]):
+        """Add reactions to a message in order.
+
+        Reactions on one message are added sequentially so they display in
+        order; callers gather this across messages.
+
+        Args:
+            message: Message to react to.
+            emojis: Emojis to add, in display order.
+        """
+        for emoji in emojis:
+            await message.add_reaction(emoji)
+
+    def create_song_approval_embed(self, match: Dict) -> discord.Embed:
         """Create an embed for song approval.
 
         Args:
@@ -726,9 +960,10 @@ class JamBot(commands.Bot):
                 description=f"🎵 **{len(match['spotify_results'])} matches found - React to select**",
                 color=discord.Color.gold()
             )
-            for i, track in enumerate(match['spotify_results'][:5]):
+            # One option per select emoji; zip stops there without copying the results
+            for i, (emoji, track) in enumerate(zip(self.SELECT_EMOJIS, match['spotify_results']), 1):
                 embed.add_field(
-                    name=f"{self.SELECT_EMOJIS[i]} Option {i + 1}",
+                    name=f"{emoji} Option {i}",
                     value=f"[{track['name']}]({track['url']})\n{track['artist']} - {track['album']}\n{track['url']}",
                     inline=False
                 )
@@ -769,14 +1004,12 @@ class JamBot(commands.Bot):
             return
 
         # Check if reaction is on an active workflow message
-        if payload.message_id not in self.active_workflows:
+        workflow = self.active_workflows.get(payload.message_id)
+        if workflow is None:
             return
 
         logger.info(f"Received reaction {payload.emoji} on workflow message {payload.message_id}")
 
-        workflow = self.active_workflows[payload.message_id]
-        emoji_str = str(payload.emoji)
-
         # Check if this is the summary message
         if payload.message_id == workflow.get('summary_message_id'):
             if emoji_str == self.APPROVE_EMOJI:
@@ -784,8 +1017,7 @@ class JamBot(commands.Bot):
             elif emoji_str == self.REJECT_EMOJI:
                 # Get the channel to send cancellation message
                 try:
-                    user = await self.fetch_user(payload.user_id)
-                    dm_channel = await user.create_dm()
+                    dm_channel = await self._get_dm_channel(payload.user_id)
                     await dm_channel.send("❌ Playlist creation cancelled.")
                 except Exception as e:
                     logger.error(f"Failed to send cancellation message: {e}")
@@ -795,17 +1027,14 @@ class JamBot(commands.Bot):
 
         # Handle song selection reactions
         # Find which song this message corresponds to
-        try:
-            msg_index = workflow['message_ids'].index(payload.message_id)
-        except ValueError:
+        match = self._get_message_match(workflow, payload.message_id)
+        if match is None:
             logger.warning(f"Message {payload.message_id} not found in workflow message_ids")
             return
 
-        match = workflow['song_matches'][msg_index]
-
-        if emoji_str in self.SELECT_EMOJIS:
+        idx = self.SELECT_EMOJI_INDEX.get(emoji_str)
+        if idx is not None:
             # Multiple choice selection
-            idx = self.SELECT_EMOJIS.index(emoji_str)
             if idx < len(match['spotify_results']):
                 track_info = match['spotify_results'][idx]
                 
@@ -842,8 +1071,7 @@ class JamBot(commands.Bot):
 
                 # Send confirmation via DM
                 try:
-                    user = await self.fetch_user(payload.user_id)
-                    dm_channel = await user.create_dm()
+                    dm_channel = await self._get_dm_channel(payload.user_id)
                     await dm_channel.send(f"✅ Selected option {idx + 1} for **{match['title']}**")
                 except Exception as e:
                     logger.error(f"Failed to send selection confirmation: {e}")
@@ -869,11 +1097,11 @@ class JamBot(commands.Bot):
                 # Get approvers from database using guild_id from workflow
                 guild_id = workflow.get('guild_id')
                 workflow_id = workflow.get('id', 'unknown')
-                approver_ids = self.db.get_approver_ids(guild_id) if guild_id else []
+                approver_ids = self.get_approver_ids(guild_id) if guild_id else []
 
                 # Fall back to env var if no approvers configured
-                if not approver_ids and Config.DISCORD_ADMIN_ID:
-                    approver_ids = [int(Config.DISCORD_ADMIN_ID)]
+                if not approver_ids and self._fallback_admin_id:
+                    approver_ids = [self._fallback_admin_id]
 
                 error_message = (
                     f"⚠️ **Cannot create playlist** (Workflow #{workflow_id})\n\n"
@@ -888,8 +1116,7 @@ class JamBot(commands.Bot):
 
                 if approver_ids:
                     # Notify the first approver about the issue
-                    admin = await self.fetch_user(approver_ids[0])
-                    dm_channel = await admin.create_dm()
+                    dm_channel = await self._get_dm_channel(approver_ids[0])
                     await dm_channel.send(error_message)
                 else:
                     logger.error(f"Cannot notify about missing songs - no approvers configured: {missing_songs}")
@@ -904,7 +1131,7 @@ class JamBot(commands.Bot):
             guild_id = channel.guild.id if channel and hasattr(channel, 'guild') else None
 
             # Get configuration to determine playlist name and target channel
-            config = self.db.get_bot_configuration(guild_id) if guild_id else None
+            config = self.get_guild_config(guild_id) if guild_id else None
 
             # Determine playlist name from template or use default
             if config and config.get('playlist_name_template'):
@@ -929,47 +1156,48 @@ class JamBot(commands.Bot):
                 playlist_name=playlist_name
             )
 
-            # Prepare track URIs and update database
+            # Prepare track URIs and song rows
             # Sort by numeric value since keys are strings from JSONB
+            title_by_number = {m['number']: m['title'] for m in workflow['song_matches']}
             track_uris = []
+            setlist_songs = []
             for song_num in sorted(selections.keys(), key=int):
                 track = selections[song_num]
 
-                # Find original song title from matches (compare with int since match['number'] is int)
-                song_title = next(
-                    m['title'] for m in workflow['song_matches']
-                    if m['number'] == int(song_num)
-                )
-
-                # Add/update song in database
-                song_id = self.db.add_or_update_song(
-                    guild_id=guild_id or 0,
-                    song_title=song_title,
-                    spotify_track_id=track['id'],
-                    spotify_track_name=track['name'],
-                    artist=track['artist'],
-                    album=track['album'],
-                    spotify_url=track['url']
-                )
+                # Find original song title (match['number'] is int, selection keys are strings)
+                song_title = title_by_number[int(song_num)]
 
-                # Link song to setlist
-                self.db.add_setlist_song(setlist_id, song_id, position=int(song_num))
+                setlist_songs.append({
+                    'song_title': song_title,
+                    'spotify_track_id': track['id'],
+                    'spotify_track_name': track['name'],
+                    'artist': track['artist'],
+                    'album': track['album'],
+                    'spotify_url': track['url'],
+                    'position': int(song_num),
+                })
 
                 # Add to playlist
                 track_uris.append(track['uri'])
 
-            # Create Spotify client for this guild
-            spotify = SpotifyClient(guild_id=guild_id)
+            # Add/update songs and link them to the setlist in one transaction
+            await asyncio.to_thread(
+                self.db.bulk_add_setlist_songs, guild_id or 0, setlist_id, setlist_songs
+            )
+
+            # Get Spotify client for this guild
+            spotify = await self._run_spotify(self.get_spotify_for_guild, guild_id)
 
             # Create Spotify playlist
-            playlist_info = spotify.create_playlist(
+            playlist_info = await self._run_spotify(
+                spotify.create_playlist,
                 name=playlist_name,
                 description=f"Bluegrass jam setlist for {setlist_data['time']} on {setlist_data['date']}",
                 public=True
             )
 
             # Add tracks
-            spotify.add_tracks_to_playlist(playlist_info['id'], track_uris)
+            await self._run_spotify(spotify.add_tracks_to_playlist, playlist_info['id'], track_uris)
 
             # Update database with playlist info
             self.db.update_setlist_playlist(
@@ -1028,6 +1256,19 @@ class JamBot(commands.Bot):
             logger.info(f"Cleaning up workflow {workflow.get('summary_message_id')} after error")
             self.cleanup_workflow(workflow)
 
+    def register_workflow(self, workflow: Dict):
+        """Index a workflow under each of its song messages and its summary message.
+
+        Every key references the same workflow dict, so reaction and DM reply
+        handlers resolve a workflow with a single lookup.
+
+        Args:
+            workflow: Workflow data dictionary with message_ids and summary_message_id.
+        """
+        self.active_workflows.update(
+            dict.fromkeys(workflow['message_ids'] + [workflow['summary_message_id']], workflow)
+        )
+
     def cleanup_workflow(self, workflow: Dict):
         """Clean up a completed or cancelled workflow.
 
@@ -1035,9 +1276,9 @@ class JamBot(commands.Bot):
             workflow: Workflow data dictionary.
         """
         # Remove from active workflows
-        for msg_id in workflow['message_ids'] + [workflow.get('summary_message_id')]:
-            if msg_id in self.active_workflows:
-                del self.active_workflows[msg_id]
+        for msg_id in workflow['message_ids']:
+            self.active_workflows.pop(msg_id, None)
+        self.active_workflows.pop(workflow.get('summary_message_id'), None)
 
         # Delete from database
         try:
@@ -1050,6 +1291,35 @@ class JamBot(commands.Bot):
 
         logger.info("Cleaned up workflow")
 
+    def cleanup_workflows(self, workflows: List[Dict]):
+        """Clean up a batch of completed, cancelled or expired workflows.
+
+        Args:
+            workflows: Workflow data dictionaries.
+        """
+        if not workflows:
+            return
+
+        stale_ids = set()
+        summary_ids = []
+        for workflow in workflows:
+            stale_ids.update(workflow['message_ids'])
+            if workflow.get('summary_message_id'):
+                summary_ids.append(workflow['summary_message_id'])
+        stale_ids.update(summary_ids)
+
+        # Remove from active workflows
+        for msg_id in stale_ids & self.active_workflows.keys():
+            del self.active_workflows[msg_id]
+
+        # Delete from database
+        try:
+            self.db.delete_workflows(summary_ids)
+        except Exception as e:
+            logger.error(f"Failed to delete workflows from database: {e}", exc_info=True)
+
+        logger.info(f"Cleaned up {len(workflows)} workflows")
+
     async def notify_admin(self, message: str, guild_id: int = None):
         """Send a notification message to all configured approvers.
 
@@ -1060,13 +1330,13 @@ class JamBot(commands.Bot):
         try:
             approver_ids = []
 
-            # Try to get approvers from database if guild_id provided
+            # Try to get approvers from the cached guild config if guild_id provided
             if guild_id:
-                approver_ids = self.db.get_approver_ids(guild_id)
+                approver_ids = self.get_approver_ids(guild_id)
 
             # Fall back to env var if no approvers configured
-            if not approver_ids and Config.DISCORD_ADMIN_ID:
-                approver_ids = [int(Config.DISCORD_ADMIN_ID)]
+            if not approver_ids and self._fallback_admin_id:
+                approver_ids = [self._fallback_admin_id]
                 logger.info("Using fallback admin from environment variable")
 
             if not approver_ids:
@@ -1076,19 +1346,44 @@ class JamBot(commands.Bot):
                 )
                 return
 
-            # Send to all approvers
-            for approver_id in approver_ids:
-                try:
-                    user = await self.fetch_user(approver_id)
-                    if user:
-                        dm_channel = await user.create_dm()
-                        await dm_channel.send(message)
-                except Exception as e:
-                    logger.error(f"Failed to notify user {approver_id}: {e}")
+            # Send to all approvers concurrently; one failure doesn't stop the rest
+            results = await asyncio.gather(
+                *(self._notify_user(approver_id, message) for approver_id in approver_ids),
+                return_exceptions=True
+            )
+            for approver_id, result in zip(approver_ids, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Failed to notify user {approver_id}: {result}")
 
         except Exception as e:
             logger.error(f"Failed to notify approvers: {e}")
 
+    async def _notify_user(self, user_id: int, message: str):
+        """Send a notification DM to one user, bounded by the notify semaphore.
+
+        Args:
+            user_id: Discord user ID to notify.
+            message: Message to send.
+        """
+        async with self._notify_semaphore:
+            dm_channel = await self._get_dm_channel(user_id)
+            await self._acquire_dm_token()
+            await dm_channel.send(message)
+
+    async def _acquire_dm_token(self):
+        """Wait until the notification token bucket allows another DM.
+
+        The token is reserved before sleeping (the balance may go negative),
+        so concurrent senders queue up at NOTIFY_RATE instead of racing.
+        """
+        now = time.monotonic()
+        elapsed = now - self._dm_tokens_updated
+        self._dm_tokens = min(self.NOTIFY_RATE, self._dm_tokens + elapsed * self.NOTIFY_RATE)
+        self._dm_tokens_updated = now
+        self._dm_tokens -= 1
+        if self._dm_tokens < 0:
+            await asyncio.sleep(-self._dm_tokens / self.NOTIFY_RATE)
+
     async def notify_feedback(
         self,
         feedback_id: int,
@@ -1115,7 +1410,7 @@ class JamBot(commands.Bot):
                 logger.info("No FEEDBACK_NOTIFY_USER_ID configured - skipping notification")
                 return
 
-            maintainer = await self.fetch_user(int(maintainer_id))
+            maintainer = await self._get_user(int(maintainer_id))
             if not maintainer:
                 logger.warning(f"Could not find maintainer user {maintainer_id}")
                 return
@@ -1138,7 +1433,7 @@ class JamBot(commands.Bot):
                 notification += f"\n\n**Context:**\n{context}"
 
             # Send DM to maintainer
-            dm_channel = await maintainer.create_dm()
+            dm_channel = maintainer.dm_channel or await maintainer.create_dm()
             await dm_channel.send(notification)
 
             # Mark as notified in database
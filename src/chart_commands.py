@@ -5,10 +5,15 @@ PDF generation, chord parsing, and transposition are handled by the Premium API.
 """
 import re
 import io
+import time
+import asyncio
+import json
 import math
+import hashlib
+from collections import OrderedDict
 import discord
 from discord import app_commands, ui
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Callable
 
 from src.logger import logger
 from src.database import Database
@@ -22,6 +27,27 @@ from src.premium_client import (
 )
 
 
+# Mention handling patterns, compiled once at import rather than per message
+_MENTION_STRIP = re.compile(r'<@[!&]?\d+>')
+
+# Create and lookup requests fused into one pattern. Each branch carries its
+# own lazy prefix so every create position is tried before any lookup, and
+# the optional key suffix is preferred over folding "in <key>" into the title.
+_CHART_REQUEST = re.compile(
+    r'(?s:.*?)(?P<create>(?:create|add|make|new)\s+(?:a\s+)?(?:chord\s*chart|chords?|chart))'
+    r'(?:\s+(?:for\s+)?(?P<create_title>.+?)(?:\s+in\s+(?P<create_key>[A-Ga-g][#b]?))?)?\s*$'
+    r'|(?s:.*?)(?P<lookup>(?:chord\s*chart|chords?|chart)\s+for\s+'
+    r'(?P<lookup_title>.+?)(?:\s+in\s+(?P<lookup_key>[A-Ga-g][#b]?))?)\s*$',
+    re.IGNORECASE,
+)
+
+# Characters replaced when a chart title becomes a PDF filename
+_FILENAME_TABLE = str.maketrans({' ': '_', '/': '_', '\\': '_', ':': '_'})
+
+# "<title> by <artist>" in generate requests
+_TITLE_BY_ARTIST = re.compile(r'^(.+?)\s+by\s+(.+)$', re.IGNORECASE)
+
+
 # ============================================================================
 # LOCAL HELPER FUNCTIONS
 # These functions provide minimal local functionality for data transformation
@@ -63,12 +89,9 @@ def parse_chord_input_local(
     sections = []
     for i, raw in enumerate(chord_sections_raw):
         label = labels[i] if i < len(labels) else f"Section {i + 1}"
-        # Parse chords: split by | for measures, spaces for beats
-        chords = []
-        measures = [m.strip() for m in raw.replace('|', '\n').split('\n') if m.strip()]
-        for measure in measures:
-            measure_chords = [c.strip() for c in measure.split() if c.strip()]
-            chords.extend(measure_chords)
+        # Parse chords: | separates measures, whitespace separates beats.
+        # Both are just delimiters here, so one split flattens the section.
+        chords = raw.replace('|', ' ').split()
 
         # TNBGJ songbook format: 8 columns, 4 rows standard
         cols = 8
@@ -86,11 +109,13 @@ def parse_chord_input_local(
         lyric_blocks = [
             block.strip() for block in lyrics_text.strip().split('\n\n') if block.strip()
         ]
-        lyrics = []
-        for i, block in enumerate(lyric_blocks):
-            label = labels[i] if i < len(labels) else f"Section {i + 1}"
-            lines = [line.strip() for line in block.split('\n') if line.strip()]
-            lyrics.append({'label': label, 'lines': lines})
+        lyrics = [
+            {
+                'label': labels[i] if i < len(labels) else f"Section {i + 1}",
+                'lines': [line.strip() for line in block.split('\n') if line.strip()],
+            }
+            for i, block in enumerate(lyric_blocks)
+        ]
 
     return {
         'title': title,
@@ -152,7 +177,7 @@ async def render_chart_pdf_via_api(
         APIConnectionError: If API is unreachable.
         PremiumAPIError: If rendering fails.
     """
-    premium_config = db.get_premium_config(guild_id)
+    premium_config = await asyncio.to_thread(db.get_premium_config, guild_id)
     token = premium_config.get('premium_api_token')
 
     if not token:
@@ -184,7 +209,7 @@ async def transpose_chart_via_api(
         APIConnectionError: If API is unreachable.
         PremiumAPIError: If transposition fails.
     """
-    premium_config = db.get_premium_config(guild_id)
+    premium_config = await asyncio.to_thread(db.get_premium_config, guild_id)
     token = premium_config.get('premium_api_token')
 
     if not token:
@@ -202,17 +227,36 @@ async def transpose_chart_via_api(
 class CreateChartView(ui.View):
     """View with a button to open the chord chart creation modal."""
 
-    def __init__(self, db: Database, prefill_title: str = None):
-        super().__init__(timeout=300)  # 5 minute timeout
+    def __init__(
+        self, db: Database, prefill_title: str = None, bot=None,
+        on_chart_saved: Optional[Callable[[int], None]] = None,
+    ):
+        super().__init__(timeout=120)  # 2 minute timeout
         self.db = db
+        self.bot = bot  # Serves the premium check from its cached guild config when set
         self.prefill_title = prefill_title
+        self.on_chart_saved = on_chart_saved  # Passed through to the modal
+        self.message: Optional[discord.Message] = None  # Set by the sender so timeout can disable the button
+
+    async def on_timeout(self):
+        """Disable the button once the view expires."""
+        for child in self.children:
+            child.disabled = True
+        if self.message:
+            try:
+                await self.message.edit(view=self)
+            except discord.HTTPException:
+                pass  # Message deleted or no longer editable
 
     @ui.button(label="Create Chart", style=discord.ButtonStyle.primary, emoji="📝")
     async def create_button(self, interaction: discord.Interaction, button: ui.Button):
         guild_id = interaction.guild_id
 
         # Check if premium is enabled
-        is_premium = self.db.is_premium_enabled(guild_id)
+        if self.bot:
+            is_premium = self.bot.is_premium_enabled(guild_id)
+        else:
+            is_premium = await asyncio.to_thread(self.db.is_premium_enabled, guild_id)
         logger.info(f"Premium check for chart creation in guild {guild_id}: enabled={is_premium}")
 
         if not is_premium:
@@ -226,16 +270,23 @@ class CreateChartView(ui.View):
             )
             return
 
-        modal = ChartCreateModal(self.db, prefill_title=self.prefill_title)
+        modal = ChartCreateModal(
+            self.db, prefill_title=self.prefill_title, on_chart_saved=self.on_chart_saved
+        )
         await interaction.response.send_modal(modal)
+        self.stop()
 
 
 class ChartCreateModal(ui.Modal, title="Create Chord Chart"):
     """Modal for inputting chord chart data."""
 
-    def __init__(self, db, prefill_title: str = None):
+    def __init__(
+        self, db, prefill_title: str = None,
+        on_chart_saved: Optional[Callable[[int], None]] = None,
+    ):
         super().__init__()
         self.db = db
+        self.on_chart_saved = on_chart_saved  # Called with the guild ID after the chart is stored
 
         # Create TextInputs dynamically to support prefill
         self.song_title = ui.TextInput(
@@ -297,7 +348,8 @@ class ChartCreateModal(ui.Modal, title="Create Chord Chart"):
             }]
 
             # Store in database
-            self.db.create_chord_chart(
+            await asyncio.to_thread(
+                self.db.create_chord_chart,
                 guild_id=interaction.guild_id,
                 title=chart_data['title'],
                 chart_title=chart_data['title'][:20] if len(chart_data['title']) > 20 else chart_data['title'],
@@ -305,6 +357,8 @@ class ChartCreateModal(ui.Modal, title="Create Chord Chart"):
                 keys=db_keys,
                 created_by=interaction.user.id,
             )
+            if self.on_chart_saved:
+                self.on_chart_saved(interaction.guild_id)
 
             # Render PDF via Premium API
             try:
@@ -314,7 +368,7 @@ class ChartCreateModal(ui.Modal, title="Create Chord Chart"):
                     chart_data
                 )
                 pdf_buf = io.BytesIO(pdf_bytes)
-                filename = f"{chart_data['title'].replace(' ', '_')}.pdf"
+                filename = f"{chart_data['title'].translate(_FILENAME_TABLE)}.pdf"
                 file = discord.File(fp=pdf_buf, filename=filename)
 
                 await interaction.followup.send(
@@ -376,12 +430,8 @@ def _create_chart_preview_embed(chart_data: Dict[str, Any]) -> discord.Embed:
             chords = section.get('chords', [])
 
             # Format chord grid as column-major layout (4 chords per line)
-            chord_lines = []
-            for i in range(0, len(chords), 4):
-                chord_line = "  ".join(chords[i:i+4])
-                chord_lines.append(chord_line)
-
-            chord_block = "```\n" + "\n".join(chord_lines) + "\n```"
+            chord_rows = "\n".join("  ".join(chords[i:i + 4]) for i in range(0, len(chords), 4))
+            chord_block = f"```\n{chord_rows}\n```"
             embed.add_field(name=label, value=chord_block, inline=False)
 
     # Footer with status
@@ -403,12 +453,110 @@ def _create_chart_preview_embed(chart_data: Dict[str, Any]) -> discord.Embed:
 class ChartCommands:
     """Discord slash commands for chord chart management."""
 
+    PDF_CACHE_SIZE = 128
+
+    # Chart lookups (including misses) are reused briefly for repeated requests
+    CHART_LOOKUP_CACHE_TTL = 10  # seconds
+    CHART_LOOKUP_CACHE_SIZE = 256
+
     def __init__(self, bot, db, rate_limiter=None):
         self.bot = bot
         self.db = db
         self.tree = bot.tree
         self.llm_client = LLMClient()
         self.rate_limiter = rate_limiter
+        # Rendered PDFs keyed by guild + chart content hash, least recent first
+        self._pdf_cache = OrderedDict()
+        # Chart lookups keyed by (guild, requested title), least recent first
+        self._chart_cache: OrderedDict = OrderedDict()
+
+    async def _db(self, fn, *args, **kwargs):
+        """Run a synchronous database call without blocking the event loop.
+
+        Args:
+            fn: Bound Database method to call.
+            *args: Positional arguments for fn.
+            **kwargs: Keyword arguments for fn.
+
+        Returns:
+            Whatever fn returns.
+        """
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    async def _find_chart(self, guild_id: int, title: str) -> Optional[Dict[str, Any]]:
+        """Look up a chart by exact title, falling back to the first fuzzy match.
+
+        Results, including misses, are cached for CHART_LOOKUP_CACHE_TTL seconds,
+        keeping at most CHART_LOOKUP_CACHE_SIZE lookups.
+
+        Args:
+            guild_id: Discord guild ID.
+            title: Song title as requested.
+
+        Returns:
+            Chart dictionary, or None if nothing matches.
+        """
+        cache_key = (guild_id, title)
+        cached = self._chart_cache.get(cache_key)
+        if cached and cached[0] > time.monotonic():
+            self._chart_cache.move_to_end(cache_key)
+            return cached[1]
+
+        chart = await self._db(self.db.get_chord_chart, guild_id, title)
+        if not chart:
+            charts = await self._db(self.db.search_chord_charts, guild_id, title)
+            chart = charts[0] if charts else None
+
+        self._chart_cache[cache_key] = (time.monotonic() + self.CHART_LOOKUP_CACHE_TTL, chart)
+        self._chart_cache.move_to_end(cache_key)
+        if len(self._chart_cache) > self.CHART_LOOKUP_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+        return chart
+
+    def invalidate_chart_cache(self, guild_id: int):
+        """Drop cached chart lookups for a guild after its charts change.
+
+        Args:
+            guild_id: Discord guild ID.
+        """
+        for cache_key in [k for k in self._chart_cache if k[0] == guild_id]:
+            del self._chart_cache[cache_key]
+
+    async def _render_pdf(self, guild_id: int, chart_data: Dict[str, Any]) -> bytes:
+        """Render a chart to PDF, reusing a previous render of identical content.
+
+        Entries are keyed on the chart content itself, so an edited or
+        transposed chart hashes differently and never hits a stale PDF.
+        Cached PDFs are only served while the guild still has premium enabled.
+
+        Args:
+            guild_id: Discord guild ID.
+            chart_data: Chart data in Premium API ChartData format.
+
+        Returns:
+            PDF bytes.
+
+        Raises:
+            InvalidTokenError: If the guild no longer has premium configured.
+        """
+        digest = hashlib.sha256(
+            json.dumps(chart_data, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        cache_key = f"{guild_id}:{digest}"
+
+        pdf_bytes = self._pdf_cache.get(cache_key)
+        if pdf_bytes is not None:
+            # A hit skips the API's token check, so enforce premium here
+            if not self.bot.is_premium_enabled(guild_id):
+                raise InvalidTokenError("Premium is not enabled for this guild")
+            self._pdf_cache.move_to_end(cache_key)
+            return pdf_bytes
+
+        pdf_bytes = await render_chart_pdf_via_api(self.db, guild_id, chart_data)
+        self._pdf_cache[cache_key] = pdf_bytes
+        if len(self._pdf_cache) > self.PDF_CACHE_SIZE:
+            self._pdf_cache.popitem(last=False)
+        return pdf_bytes
 
     async def setup(self):
         """Register chord chart slash commands."""
@@ -493,7 +641,8 @@ class ChartCommands:
             status_value = status.value if status else 'all'
 
             # Get total count and first page
-            charts, total = self.db.list_chord_charts_filtered(
+            charts, total = await self._db(
+                self.db.list_chord_charts_filtered,
                 interaction.guild_id, status_value, limit=10, offset=0
             )
 
@@ -535,7 +684,7 @@ class ChartCommands:
         guild_id = interaction.guild_id
 
         # Check if premium is enabled
-        if not self.db.is_premium_enabled(guild_id):
+        if not self.bot.is_premium_enabled(guild_id):
             await interaction.response.send_message(
                 "**Premium Required**\n\n"
                 "Creating chord charts requires premium access.\n\n"
@@ -549,7 +698,7 @@ class ChartCommands:
             return
 
         # Premium is enabled, show the create modal
-        modal = ChartCreateModal(self.db)
+        modal = ChartCreateModal(self.db, on_chart_saved=self.invalidate_chart_cache)
         await interaction.response.send_modal(modal)
 
     async def _handle_view(
@@ -582,17 +731,12 @@ class ChartCommands:
 
         await interaction.response.defer(thinking=True)
 
-        chart = self.db.get_chord_chart(interaction.guild_id, song_title)
+        chart = await self._find_chart(interaction.guild_id, song_title)
         if not chart:
-            # Try fuzzy match
-            charts = self.db.search_chord_charts(interaction.guild_id, song_title)
-            if charts:
-                chart = charts[0]
-            else:
-                await interaction.followup.send(
-                    f"No chord chart found for \"{song_title}\".", ephemeral=True
-                )
-                return
+            await interaction.followup.send(
+                f"No chord chart found for \"{song_title}\".", ephemeral=True
+            )
+            return
 
         # Convert database format to Premium API format
         api_chart_data = convert_db_chart_to_api_format(chart)
@@ -619,13 +763,9 @@ class ChartCommands:
 
         # Render PDF via Premium API
         try:
-            pdf_bytes = await render_chart_pdf_via_api(
-                self.db,
-                interaction.guild_id,
-                api_chart_data
-            )
+            pdf_bytes = await self._render_pdf(interaction.guild_id, api_chart_data)
             pdf_buf = io.BytesIO(pdf_bytes)
-            filename = f"{chart['title'].replace(' ', '_')}_{display_key}.pdf"
+            filename = f"{chart['title'].translate(_FILENAME_TABLE)}_{display_key}.pdf"
             file = discord.File(fp=pdf_buf, filename=filename)
 
             # Build message with rate limit info if available
@@ -654,18 +794,24 @@ class ChartCommands:
         """List all chord charts for this guild."""
         await interaction.response.defer(thinking=True)
 
-        charts = self.db.list_chord_charts(interaction.guild_id)
+        charts = await self._db(self.db.list_chord_charts, interaction.guild_id)
         if not charts:
             await interaction.followup.send("No chord charts saved yet.")
             return
 
-        lines = []
+        lines = ["**Chord Charts:**"]
+        length = len(lines[0])
         for chart in charts:
-            keys_str = ", ".join(k['key'] for k in chart.get('keys', []))
+            # Everything past the Discord limit is truncated, so stop formatting there
+            if length > 1900:
+                break
+            keys_str = ", ".join(k['key'] for k in chart.get('keys', ()))
             creator = f"<@{chart['created_by']}>" if chart.get('created_by') else "Unknown"
-            lines.append(f"- **{chart['title']}** (Key of {keys_str}) — by {creator}")
+            line = f"- **{chart['title']}** (Key of {keys_str}) — by {creator}"
+            lines.append(line)
+            length += len(line) + 1
 
-        msg = "**Chord Charts:**\n" + "\n".join(lines)
+        msg = "\n".join(lines)
         # Truncate if too long for Discord
         if len(msg) > 1900:
             msg = msg[:1900] + "\n..."
@@ -703,20 +849,16 @@ class ChartCommands:
 
         await interaction.response.defer(thinking=True)
 
-        chart = self.db.get_chord_chart(interaction.guild_id, song_title)
+        chart = await self._find_chart(interaction.guild_id, song_title)
         if not chart:
-            charts = self.db.search_chord_charts(interaction.guild_id, song_title)
-            if charts:
-                chart = charts[0]
-            else:
-                await interaction.followup.send(
-                    f"No chord chart found for \"{song_title}\".", ephemeral=True
-                )
-                return
+            await interaction.followup.send(
+                f"No chord chart found for \"{song_title}\".", ephemeral=True
+            )
+            return
 
         # Check if key already exists
-        existing_keys = [k['key'] for k in chart.get('keys', [])]
-        if new_key in existing_keys:
+        existing_keys = {k['key'].upper() for k in chart.get('keys', ())}
+        if new_key.upper() in existing_keys:
             await interaction.followup.send(
                 f"**{chart['title']}** already has a Key of {new_key} variant.",
                 ephemeral=True,
@@ -763,17 +905,14 @@ class ChartCommands:
         }
         new_keys = chart['keys'] + [transposed_key_entry]
 
-        self.db.update_chord_chart_keys(interaction.guild_id, chart['title'], new_keys)
+        await self._db(self.db.update_chord_chart_keys, interaction.guild_id, chart['title'], new_keys)
+        self.invalidate_chart_cache(interaction.guild_id)
 
         # Render PDF with new key via Premium API
         try:
-            pdf_bytes = await render_chart_pdf_via_api(
-                self.db,
-                interaction.guild_id,
-                transposed_chart
-            )
+            pdf_bytes = await self._render_pdf(interaction.guild_id, transposed_chart)
             pdf_buf = io.BytesIO(pdf_bytes)
-            filename = f"{chart['title'].replace(' ', '_')}_{new_key}.pdf"
+            filename = f"{chart['title'].translate(_FILENAME_TABLE)}_{new_key}.pdf"
             file = discord.File(fp=pdf_buf, filename=filename)
 
             # Build message with rate limit info if available
@@ -811,7 +950,7 @@ class ChartCommands:
             return
 
         # Check if premium is enabled
-        if not self.db.is_premium_enabled(guild_id):
+        if not self.bot.is_premium_enabled(guild_id):
             await interaction.response.send_message(
                 "**Premium Required**\n\n"
                 "AI chord chart generation requires premium access.\n\n"
@@ -826,13 +965,13 @@ class ChartCommands:
 
         # Parse artist from "by Artist" pattern
         artist = None
-        match = re.match(r'^(.+?)\s+by\s+(.+)$', song_title, re.IGNORECASE)
+        match = _TITLE_BY_ARTIST.match(song_title)
         if match:
             song_title = match.group(1).strip()
             artist = match.group(2).strip()
 
         # Check if chart already exists with fuzzy search
-        existing_chart = self.db.fuzzy_search_chord_chart(guild_id, song_title)
+        existing_chart = await self._db(self.db.fuzzy_search_chord_chart, guild_id, song_title)
 
         if existing_chart:
             status = existing_chart.get('status', 'approved')
@@ -840,13 +979,9 @@ class ChartCommands:
                 # Return existing chart as PDF via Premium API
                 api_chart_data = convert_db_chart_to_api_format(existing_chart)
                 try:
-                    pdf_bytes = await render_chart_pdf_via_api(
-                        self.db,
-                        guild_id,
-                        api_chart_data
-                    )
+                    pdf_bytes = await self._render_pdf(guild_id, api_chart_data)
                     pdf_buf = io.BytesIO(pdf_bytes)
-                    filename = f"{existing_chart['title'].replace(' ', '_')}.pdf"
+                    filename = f"{existing_chart['title'].translate(_FILENAME_TABLE)}.pdf"
                     file = discord.File(fp=pdf_buf, filename=filename)
 
                     await interaction.followup.send(
@@ -868,7 +1003,7 @@ class ChartCommands:
                 return
 
         # Get premium token
-        premium_config = self.db.get_premium_config(guild_id)
+        premium_config = await self._db(self.db.get_premium_config, guild_id)
         token = premium_config.get('premium_api_token')
 
         # Generate via Premium API
@@ -933,26 +1068,19 @@ class ChartCommands:
                 lyrics = lyrics_data
             # If AI returned a string for lyrics, ignore it (PDF expects list format)
 
-            # Save to database as draft
-            chart_id = self.db.create_chord_chart(
+            # Save draft chart and generation history in one transaction
+            await self._db(
+                self.db.create_generated_chord_chart,
                 guild_id=guild_id,
                 title=chart_title,
-                chart_title=None,
-                lyrics=lyrics,
                 keys=keys,
                 created_by=interaction.user.id,
-                source='ai_generated',
-                status='draft',
-                alternate_titles=None,
-            )
-
-            # Save generation history
-            self.db.create_generation_history(
-                chart_id=chart_id,
                 prompt=f"Generate chord chart for '{song_title}'" + (f" by {artist}" if artist else ""),
                 response=chart,
                 model='premium_api',
+                lyrics=lyrics,
             )
+            self.invalidate_chart_cache(guild_id)
 
             # Build API chart data for PDF rendering
             api_chart_data = {
@@ -966,13 +1094,9 @@ class ChartCommands:
 
             # Render PDF via Premium API
             try:
-                pdf_bytes = await render_chart_pdf_via_api(
-                    self.db,
-                    guild_id,
-                    api_chart_data
-                )
+                pdf_bytes = await self._render_pdf(guild_id, api_chart_data)
                 pdf_buf = io.BytesIO(pdf_bytes)
-                filename = f"{chart_title.replace(' ', '_')}.pdf"
+                filename = f"{chart_title.translate(_FILENAME_TABLE)}.pdf"
                 file = discord.File(fp=pdf_buf, filename=filename)
 
                 await interaction.followup.send(
@@ -1036,11 +1160,7 @@ class ChartCommands:
         await interaction.response.defer(thinking=True)
 
         # Try to find the chart (exact or fuzzy match)
-        chart = self.db.get_chord_chart(interaction.guild_id, song_title)
-        if not chart:
-            charts = self.db.search_chord_charts(interaction.guild_id, song_title)
-            if charts:
-                chart = charts[0]
+        chart = await self._find_chart(interaction.guild_id, song_title)
 
         if not chart:
             await interaction.followup.send(
@@ -1051,7 +1171,8 @@ class ChartCommands:
 
         # Delete the chart
         try:
-            deleted = self.db.delete_chord_chart(interaction.guild_id, chart['title'])
+            deleted = await self._db(self.db.delete_chord_chart, interaction.guild_id, chart['title'])
+            self.invalidate_chart_cache(interaction.guild_id)
 
             if deleted:
                 await interaction.followup.send(
@@ -1082,28 +1203,26 @@ class ChartCommands:
         """
         content = message.content
         # Strip user and role mentions
-        content = re.sub(r'<@[!&]?\d+>', '', content).strip()
+        content = _MENTION_STRIP.sub('', content).strip()
 
-        # Check for explicit create requests first
-        create_patterns = [
-            r'(?:create|add|make|new)\s+(?:a\s+)?(?:chord\s*chart|chords?|chart)\s+(?:for\s+)?(.+?)\s+in\s+([A-Ga-g][#b]?)\s*$',
-            r'(?:create|add|make|new)\s+(?:a\s+)?(?:chord\s*chart|chords?|chart)\s+(?:for\s+)?(.+?)\s*$',
-            r'(?:create|add|make|new)\s+(?:a\s+)?(?:chord\s*chart|chords?|chart)\s*$',
-        ]
+        # Every request phrasing names a chart or chords; skip the regex otherwise
+        lowered = content.lower()
+        if 'chart' not in lowered and 'chord' not in lowered:
+            return
 
+        # One pass classifies the request; create phrasing wins over lookup
         is_create_request = False
         song_title = None
         requested_key = None
 
-        for pattern in create_patterns:
-            m = re.search(pattern, content, re.IGNORECASE)
-            if m:
-                is_create_request = True
-                if m.lastindex >= 1:
-                    song_title = m.group(1).strip().strip('"\'')
-                if m.lastindex >= 2:
-                    requested_key = m.group(2).strip()
-                break
+        m = _CHART_REQUEST.match(content)
+        if m:
+            prefix = 'create' if m.group('create') else 'lookup'
+            is_create_request = prefix == 'create'
+            if m.group(f'{prefix}_title'):
+                song_title = m.group(f'{prefix}_title').strip().strip('"\'')
+            if m.group(f'{prefix}_key'):
+                requested_key = m.group(f'{prefix}_key').strip()
 
         # Get guild_id early for premium checks
         guild_id = message.guild.id if message.guild else 0
@@ -1112,7 +1231,7 @@ class ChartCommands:
             logger.info(f"Chart create request via mention: title='{song_title}'")
 
             # Check premium status for create requests
-            if not self.db.is_premium_enabled(guild_id):
+            if not self.bot.is_premium_enabled(guild_id):
                 await message.reply(
                     "**Premium Required**\n\n"
                     "Creating chord charts requires premium access.\n\n"
@@ -1122,29 +1241,16 @@ class ChartCommands:
                 )
                 return
 
-            view = CreateChartView(self.db, prefill_title=song_title)
-            await message.reply(
+            view = CreateChartView(
+                self.db, prefill_title=song_title, bot=self.bot,
+                on_chart_saved=self.invalidate_chart_cache,
+            )
+            view.message = await message.reply(
                 "Click below to create a new chord chart:",
                 view=view,
             )
             return
 
-        # Try to extract song title for lookup
-        lookup_patterns = [
-            r'(?:chord\s*chart|chords?|chart)\s+for\s+(.+?)\s+in\s+([A-Ga-g][#b]?)\s*$',
-            r'(?:chord\s*chart|chords?|chart)\s+for\s+(.+?)\s*$',
-            r'(?:need|want|get)\s+(?:a\s+)?(?:chord\s*chart|chords?|chart)\s+for\s+(.+?)\s+in\s+([A-Ga-g][#b]?)\s*$',
-            r'(?:need|want|get)\s+(?:a\s+)?(?:chord\s*chart|chords?|chart)\s+for\s+(.+?)\s*$',
-        ]
-
-        for pattern in lookup_patterns:
-            m = re.search(pattern, content, re.IGNORECASE)
-            if m:
-                song_title = m.group(1).strip().strip('"\'')
-                if m.lastindex >= 2:
-                    requested_key = m.group(2).strip()
-                break
-
         if not song_title:
             return  # Not a chart request
 
@@ -1167,11 +1273,7 @@ class ChartCommands:
                 return
 
         # Look up chart (guild_id already set above)
-        chart = self.db.get_chord_chart(guild_id, song_title)
-        if not chart:
-            charts = self.db.search_chord_charts(guild_id, song_title)
-            if charts:
-                chart = charts[0]
+        chart = await self._find_chart(guild_id, song_title)
 
         if chart:
             # Convert to Premium API format
@@ -1198,13 +1300,9 @@ class ChartCommands:
 
             # Render PDF via Premium API
             try:
-                pdf_bytes = await render_chart_pdf_via_api(
-                    self.db,
-                    guild_id,
-                    api_chart_data
-                )
+                pdf_bytes = await self._render_pdf(guild_id, api_chart_data)
                 pdf_buf = io.BytesIO(pdf_bytes)
-                filename = f"{chart['title'].replace(' ', '_')}_{display_key}.pdf"
+                filename = f"{chart['title'].translate(_FILENAME_TABLE)}_{display_key}.pdf"
                 file = discord.File(fp=pdf_buf, filename=filename)
 
                 # Build message with rate limit info if available
@@ -1228,9 +1326,12 @@ class ChartCommands:
                 )
         else:
             # Check premium status before offering to create
-            if self.db.is_premium_enabled(guild_id):
-                view = CreateChartView(self.db, prefill_title=song_title)
-                await message.reply(
+            if self.bot.is_premium_enabled(guild_id):
+                view = CreateChartView(
+                    self.db, prefill_title=song_title, bot=self.bot,
+                    on_chart_saved=self.invalidate_chart_cache,
+                )
+                view.message = await message.reply(
                     f"I don't have a chord chart for \"{song_title}\" yet. "
                     f"Click below to create one:",
                     view=view,
@@ -144,14 +144,16 @@ class AdvancedSettingsModal(Modal, title="Advanced Settings"):
         default="Bluegrass Jam {date}"
     )
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, bot=None):
         """Initialize the advanced settings modal.
 
         Args:
             db: Database instance for storing configuration.
+            bot: Bot instance whose per-guild caches are reset on save (optional).
         """
         super().__init__()
         self.db = db
+        self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle modal submission.
@@ -210,6 +212,10 @@ class AdvancedSettingsModal(Modal, title="Advanced Settings"):
                 updated_by=interaction.user.id
             )
 
+            # Playlist channel and name template are read from the cached config
+            if self.bot:
+                self.bot.invalidate_guild_config_cache(guild_id)
+
             logger.info(
                 f"Advanced settings updated by {interaction.user.id} for guild {guild_id}: "
                 f"channel={channel_id_value}, template={playlist_template}"
@@ -284,14 +290,16 @@ class ConfigurationModal(Modal, title="Configure Jambot"):
         max_length=200
     )
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, bot=None):
         """Initialize the configuration modal.
 
         Args:
             db: Database instance for storing configuration.
+            bot: Bot instance whose per-guild caches are reset on save (optional).
         """
         super().__init__()
         self.db = db
+        self.bot = bot
 
     async def on_submit(self, interaction: discord.Interaction):
         """Handle modal submission.
@@ -362,6 +370,12 @@ class ConfigurationModal(Modal, title="Configure Jambot"):
                 updated_by=interaction.user.id
             )
 
+            # Drop cached config and any Spotify client built with the
+            # previous configuration
+            if self.bot:
+                self.bot.invalidate_guild_config_cache(guild_id)
+                self.bot.invalidate_spotify_cache(guild_id)
+
             logger.info(
                 f"Configuration updated by {interaction.user.id} for guild {guild_id}: "
                 f"jam_leaders={jam_leader_ids}, approvers={approver_ids}, "
@@ -790,7 +804,7 @@ class JambotCommands:
             )
 
             # Send the configuration modal
-            modal = ConfigurationModal(self.db)
+            modal = ConfigurationModal(self.db, self.bot)
             await interaction.response.send_modal(modal)
 
         @setup_command.error
@@ -936,7 +950,7 @@ class JambotCommands:
             )
 
             # Send the advanced settings modal
-            modal = AdvancedSettingsModal(self.db)
+            modal = AdvancedSettingsModal(self.db, self.bot)
             await interaction.response.send_modal(modal)
 
         @settings_command.error
@@ -1063,7 +1077,7 @@ class JambotCommands:
                 )
 
                 # Check if user is an approver or admin
-                approver_ids = self.db.get_approver_ids(interaction.guild_id)
+                approver_ids = self.bot.get_approver_ids(interaction.guild_id)
                 is_approver = interaction.user.id in approver_ids
                 is_admin = interaction.user.guild_permissions.administrator
 
@@ -1435,10 +1449,8 @@ class JambotCommands:
                 await interaction.response.defer(ephemeral=True)
 
                 # Load workflow into active_workflows if not already there
-                summary_msg_id = workflow['summary_message_id']
-                if summary_msg_id not in self.bot.active_workflows:
-                    for msg_id in workflow['message_ids'] + [summary_msg_id]:
-                        self.bot.active_workflows[msg_id] = workflow
+                if workflow['summary_message_id'] not in self.bot.active_workflows:
+                    self.bot.register_workflow(workflow)
 
                 await self.bot.create_playlist_from_workflow(workflow)
 
@@ -1716,7 +1728,7 @@ class JambotCommands:
                 )
 
                 # Check if premium is enabled
-                if not self.db.is_premium_enabled(guild_id):
+                if not self.bot.is_premium_enabled(guild_id):
                     await interaction.response.send_message(
                         "**Premium not configured**\n\n"
                         "Premium access is required for AI chord chart generation.\n\n"
@@ -1824,7 +1836,7 @@ class JambotCommands:
                 )
 
                 # Check if premium is enabled
-                if not self.db.is_premium_enabled(guild_id):
+                if not self.bot.is_premium_enabled(guild_id):
                     await interaction.response.send_message(
                         "**Premium not configured**\n\n"
                         "You need to configure premium access first.\n"
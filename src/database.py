@@ -3,7 +3,7 @@ import psycopg2
 import psycopg2.extras
 import json
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Callable
 from contextlib import contextmanager
 from src.config import Config
 from src.logger import logger
@@ -19,6 +19,9 @@ class Database:
             database_url: PostgreSQL connection URL. Uses Config.DATABASE_URL if not provided.
         """
         self.database_url = database_url or Config.DATABASE_URL
+        # Called with the guild ID after premium settings change, so in-process
+        # caches of the guild configuration can be dropped (set by the bot)
+        self.on_premium_change: Optional[Callable[[int], None]] = None
 
         if not self.database_url:
             raise ValueError(
@@ -177,7 +180,6 @@ class Database:
             UNIQUE(guild_id, title)
         );
 
-        CREATE INDEX IF NOT EXISTS idx_chord_charts_guild_title ON chord_charts(guild_id, title);
         CREATE INDEX IF NOT EXISTS idx_chord_charts_title_trgm ON chord_charts USING gin (title gin_trgm_ops);
 
         CREATE TABLE IF NOT EXISTS generation_history (
@@ -256,13 +258,18 @@ class Database:
             -- Enable pg_trgm extension for fuzzy text search
             CREATE EXTENSION IF NOT EXISTS pg_trgm;
         END $$;
+        -- Serves the guild + status filtered chart list, including its ORDER BY.
+        CREATE INDEX IF NOT EXISTS idx_chord_charts_guild_status
+            ON chord_charts(guild_id, status, created_at DESC);
+        -- Duplicated the index backing UNIQUE(guild_id, title).
+        DROP INDEX IF EXISTS idx_chord_charts_guild_title;
         """
 
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(pg_trgm_setup)
-            cursor.execute(schema)
-            cursor.execute(migration)
+            # Send extension setup, schema, and migration as one batch to avoid
+            # a round-trip per script on every startup
+            cursor.execute(pg_trgm_setup + schema + migration)
             logger.info("Database schema initialized successfully")
 
     def get_song_by_title(self, guild_id: int, song_title: str) -> Optional[Dict[str, Any]]:
@@ -286,6 +293,27 @@ class Database:
                 return dict(row)
             return None
 
+    def get_songs_by_titles(self, guild_id: int, song_titles: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Look up several songs by title within a specific guild in one query.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+            song_titles: Song titles to search for.
+
+        Returns:
+            Dictionary mapping song title to song data for the titles found.
+        """
+        if not song_titles:
+            return {}
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            cursor.execute(
+                "SELECT * FROM songs WHERE guild_id = %s AND song_title = ANY(%s)",
+                (guild_id, list(song_titles))
+            )
+            return {row['song_title']: dict(row) for row in cursor.fetchall()}
+
     def add_or_update_song(
         self,
         guild_id: int,
@@ -395,6 +423,66 @@ class Database:
             )
             logger.debug(f"Added song {song_id} to setlist {setlist_id} at position {position}")
 
+    def bulk_add_setlist_songs(
+        self,
+        guild_id: int,
+        setlist_id: int,
+        songs: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """Upsert songs and link them to a setlist in a single transaction.
+
+        Equivalent to calling add_or_update_song and add_setlist_song for each
+        song, but with one multi-row statement for each table.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+            setlist_id: Setlist database ID.
+            songs: List of dicts with song_title, spotify_track_id,
+                spotify_track_name, artist, album, spotify_url, and position.
+
+        Returns:
+            Dictionary mapping song title to song ID.
+        """
+        if not songs:
+            return {}
+
+        today = datetime.now().date().isoformat()
+        song_rows = {
+            song['song_title']: (
+                guild_id, song['song_title'], song['spotify_track_id'], song['spotify_track_name'],
+                song['artist'], song['album'], song['spotify_url'], today, today
+            )
+            for song in songs
+        }
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            results = psycopg2.extras.execute_values(
+                cursor,
+                """INSERT INTO songs
+                   (guild_id, song_title, spotify_track_id, spotify_track_name, artist, album, spotify_url, first_used, last_used)
+                   VALUES %s
+                   ON CONFLICT (guild_id, song_title) DO UPDATE SET
+                       last_used = EXCLUDED.last_used,
+                       spotify_track_id = EXCLUDED.spotify_track_id,
+                       spotify_track_name = EXCLUDED.spotify_track_name,
+                       artist = EXCLUDED.artist,
+                       album = EXCLUDED.album,
+                       spotify_url = EXCLUDED.spotify_url
+                   RETURNING song_title, id""",
+                list(song_rows.values()),
+                fetch=True,
+            )
+            song_ids = dict(results)
+
+            psycopg2.extras.execute_values(
+                cursor,
+                "INSERT INTO setlist_songs (setlist_id, song_id, position) VALUES %s",
+                [(setlist_id, song_ids[song['song_title']], song['position']) for song in songs],
+            )
+            logger.info(f"Added {len(songs)} songs to setlist {setlist_id} for guild {guild_id}")
+            return song_ids
+
     def get_setlist_songs(self, setlist_id: int) -> List[Dict[str, Any]]:
         """Get all songs in a setlist, ordered by position.
 
@@ -614,9 +702,9 @@ class Database:
         config = self.get_bot_configuration(guild_id)
         if config:
             is_leader = user_id in config['jam_leader_ids']
-            logger.info(
-                f"Jam leader check for guild {guild_id}, user {user_id}: {is_leader} "
-                f"(configured leaders: {config['jam_leader_ids']})"
+            logger.debug(
+                "Jam leader check for guild %s, user %s: %s (configured leaders: %s)",
+                guild_id, user_id, is_leader, config['jam_leader_ids']
             )
             return is_leader
         else:
@@ -736,7 +824,10 @@ class Database:
                 (token, token_hash, setup_by, guild_id)
             )
             logger.info(f"Saved premium configuration for guild {guild_id} (setup by {setup_by})")
-            return True
+
+        if self.on_premium_change:
+            self.on_premium_change(guild_id)
+        return True
 
     def disable_premium(self, guild_id: int) -> bool:
         """Disable premium features for a guild.
@@ -760,7 +851,10 @@ class Database:
                 (guild_id,)
             )
             logger.info(f"Disabled premium for guild {guild_id}")
-            return True
+
+        if self.on_premium_change:
+            self.on_premium_change(guild_id)
+        return True
 
     def is_spotify_authorized(self, guild_id: int) -> bool:
         """Check if Spotify tokens exist for a guild.
@@ -779,6 +873,24 @@ class Database:
             )
             return cursor.fetchone() is not None
 
+    def get_spotify_access_token(self, guild_id: int) -> Optional[str]:
+        """Get the currently stored Spotify access token for a guild.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+
+        Returns:
+            Stored access token, or None if the guild has not authorized Spotify.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT access_token FROM spotify_tokens WHERE guild_id = %s",
+                (guild_id,)
+            )
+            row = cursor.fetchone()
+            return row[0] if row else None
+
     # --- Chord Chart Methods ---
 
     def create_chord_chart(
@@ -806,38 +918,96 @@ class Database:
             status: Chart status ('draft', 'approved', 'rejected').
             alternate_titles: Optional list of alternate title spellings.
 
+        Returns:
+            Chart database ID.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            return self._insert_chord_chart(
+                cursor, guild_id, title, keys, created_by, chart_title,
+                lyrics, source, status, alternate_titles,
+            )
+
+    def _insert_chord_chart(
+        self,
+        cursor,
+        guild_id: int,
+        title: str,
+        keys: List[Dict[str, Any]],
+        created_by: int,
+        chart_title: Optional[str],
+        lyrics: Optional[List[Dict[str, Any]]],
+        source: str,
+        status: str,
+        alternate_titles: Optional[List[str]],
+    ) -> int:
+        """Upsert a chord chart row using an open cursor.
+
         Returns:
             Chart database ID.
         """
         import json
 
+        cursor.execute(
+            """INSERT INTO chord_charts
+               (guild_id, title, chart_title, lyrics, keys, created_by, source, status, alternate_titles)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+               ON CONFLICT (guild_id, title) DO UPDATE SET
+                   chart_title = EXCLUDED.chart_title,
+                   lyrics = EXCLUDED.lyrics,
+                   keys = EXCLUDED.keys,
+                   source = EXCLUDED.source,
+                   status = EXCLUDED.status,
+                   alternate_titles = EXCLUDED.alternate_titles,
+                   updated_at = NOW()
+               RETURNING id""",
+            (
+                guild_id, title, chart_title,
+                json.dumps(lyrics) if lyrics else None,
+                json.dumps(keys),
+                created_by,
+                source,
+                status,
+                json.dumps(alternate_titles) if alternate_titles else None,
+            )
+        )
+        chart_id = cursor.fetchone()[0]
+        logger.info(f"Created/updated chord chart '{title}' for guild {guild_id} (source={source}, status={status})")
+        return chart_id
+
+    def create_generated_chord_chart(
+        self,
+        guild_id: int,
+        title: str,
+        keys: List[Dict[str, Any]],
+        created_by: int,
+        prompt: str,
+        response: Dict[str, Any],
+        model: str,
+        lyrics: Optional[List[Dict[str, Any]]] = None,
+    ) -> int:
+        """Save an AI-generated draft chart and its generation history in one transaction.
+
+        Args:
+            guild_id: Discord guild (server) ID.
+            title: Song title.
+            keys: List of key entry dicts.
+            created_by: Discord user ID.
+            prompt: Prompt used for generation.
+            response: Raw generation response data.
+            model: Model identifier.
+            lyrics: Optional lyrics data.
+
+        Returns:
+            Chart database ID.
+        """
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """INSERT INTO chord_charts
-                   (guild_id, title, chart_title, lyrics, keys, created_by, source, status, alternate_titles)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                   ON CONFLICT (guild_id, title) DO UPDATE SET
-                       chart_title = EXCLUDED.chart_title,
-                       lyrics = EXCLUDED.lyrics,
-                       keys = EXCLUDED.keys,
-                       source = EXCLUDED.source,
-                       status = EXCLUDED.status,
-                       alternate_titles = EXCLUDED.alternate_titles,
-                       updated_at = NOW()
-                   RETURNING id""",
-                (
-                    guild_id, title, chart_title,
-                    json.dumps(lyrics) if lyrics else None,
-                    json.dumps(keys),
-                    created_by,
-                    source,
-                    status,
-                    json.dumps(alternate_titles) if alternate_titles else None,
-                )
+            chart_id = self._insert_chord_chart(
+                cursor, guild_id, title, keys, created_by, None,
+                lyrics, 'ai_generated', 'draft', None,
             )
-            chart_id = cursor.fetchone()[0]
-            logger.info(f"Created/updated chord chart '{title}' for guild {guild_id} (source={source}, status={status})")
+            self._insert_generation_history(cursor, chart_id, prompt, response, model)
             return chart_id
 
     def get_chord_chart(self, guild_id: int, title: str) -> Optional[Dict[str, Any]]:
@@ -911,20 +1081,35 @@ class Database:
         Returns:
             Generation history ID.
         """
-        import json
-
         with self.get_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                """INSERT INTO generation_history
-                   (chart_id, prompt, response, model)
-                   VALUES (%s, %s, %s, %s)
-                   RETURNING id""",
-                (chart_id, prompt, json.dumps(response), model)
-            )
-            history_id = cursor.fetchone()[0]
-            logger.info(f"Created generation history {history_id} for chart {chart_id} using {model}")
-            return history_id
+            return self._insert_generation_history(cursor, chart_id, prompt, response, model)
+
+    def _insert_generation_history(
+        self,
+        cursor,
+        chart_id: int,
+        prompt: str,
+        response: Dict[str, Any],
+        model: str
+    ) -> int:
+        """Insert a generation history row using an open cursor.
+
+        Returns:
+            Generation history ID.
+        """
+        import json
+
+        cursor.execute(
+            """INSERT INTO generation_history
+               (chart_id, prompt, response, model)
+               VALUES (%s, %s, %s, %s)
+               RETURNING id""",
+            (chart_id, prompt, json.dumps(response), model)
+        )
+        history_id = cursor.fetchone()[0]
+        logger.info(f"Created generation history {history_id} for chart {chart_id} using {model}")
+        return history_id
 
     def search_chord_charts_fuzzy(
         self, guild_id: int, query: str, threshold: float = 0.3
@@ -1314,6 +1499,22 @@ class Database:
                 WHERE summary_message_id = %s
             """, (summary_message_id,))
 
+    def delete_workflows(self, summary_message_ids: List[int]) -> None:
+        """Delete several workflows from database in one statement.
+
+        Args:
+            summary_message_ids: Workflow identifiers
+        """
+        if not summary_message_ids:
+            return
+
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                DELETE FROM active_workflows
+                WHERE summary_message_id = ANY(%s)
+            """, (list(summary_message_ids),))
+
     def save_feedback(
         self,
         guild_id: int,
@@ -1,5 +1,6 @@
 """Setlist message parsing for Jambot."""
 import re
+from functools import lru_cache
 from typing import Optional, List, Dict, Tuple
 from src.logger import logger
 
@@ -29,6 +30,25 @@ class SetlistParser:
     NUMBERED_LIST_PATTERN = re.compile(r'^\s*\d+[.)]\s+.+', re.MULTILINE)
     SETLIST_KEYWORDS = ['setlist', 'set list', 'song list', 'songs for', 'jam on', 'practice']
 
+    # One or more trailing parentheticals, e.g. " (A) (faster)" after a song title
+    TRAILING_PARENS_PATTERN = re.compile(r'(?:\s*\([^)]+\))+\s*$')
+
+    # Manual override: "use this [version of] <song> for <date> <spotify track url>"
+    MANUAL_SONG_PATTERN = re.compile(
+        r'use\s+this(?:\s+version\s+of)?\s+(.+?)\s+for\s+(.+?)\s+(https?://open\.spotify\.com/track/\S+)',
+        re.IGNORECASE
+    )
+
+    # Song line patterns used by analyze_setlist_structure
+    ANALYZE_SONG_WITH_KEY_PATTERN = re.compile(
+        r'^\s*(\d+)[.)]\s+(.+?)\s+\(([A-Ga-g][#b]?[mM]?(?:aj|in)?)\)\s*(.*)$'
+    )
+    ANALYZE_SONG_NO_KEY_PATTERN = re.compile(r'^\s*(\d+)[.)]\s+(.+?)\s*$')
+    NUMBERED_LINE_PREFIX_PATTERN = re.compile(r'^\d+[.)]\s+')
+
+    # Intro matches cached per parser; detection and parsing search the same content
+    INTRO_CACHE_SIZE = 128
+
     def __init__(self, intro_pattern: Optional[str] = None, song_pattern: Optional[str] = None):
         """Initialize setlist parser with optional custom patterns.
 
@@ -59,6 +79,10 @@ class SetlistParser:
         else:
             self._song_pattern = self.SONG_LINE_PATTERN
 
+        # Memoize intro searches so parse_setlist() after is_setlist_message()
+        # on the same message (or a re-delivered one) doesn't rescan it
+        self._search_intro = lru_cache(maxsize=self.INTRO_CACHE_SIZE)(self._intro_pattern.search)
+
         logger.info("SetlistParser initialized")
 
     def is_setlist_message(self, content: str) -> bool:
@@ -73,7 +97,7 @@ class SetlistParser:
         logger.info(f"Checking if message is setlist... (length: {len(content)} chars)")
         logger.info(f"First 100 chars: {repr(content[:100])}")
 
-        match = self._intro_pattern.search(content)
+        match = self._search_intro(content)
         if match:
             time = match.group(1).strip()
             date = match.group(2).strip()
@@ -99,7 +123,7 @@ class SetlistParser:
             logger.debug(f"Full message content:\n{content}")
 
             # Extract time and date from intro
-            intro_match = self._intro_pattern.search(content)
+            intro_match = self._search_intro(content)
             if not intro_match:
                 logger.warning("Could not find setlist intro pattern")
                 return None
@@ -118,10 +142,7 @@ class SetlistParser:
 
                 # Remove all trailing keys (anything in parentheses) from the song title
                 # This handles cases like "Song Title (A) (faster)" where multiple keys exist
-                song_title = re.sub(r'\s*\([^)]+\)\s*$', '', song_title).strip()
-                # Keep removing until no more trailing parentheses
-                while re.search(r'\s*\([^)]+\)\s*$', song_title):
-                    song_title = re.sub(r'\s*\([^)]+\)\s*$', '', song_title).strip()
+                song_title = self.TRAILING_PARENS_PATTERN.sub('', song_title).strip()
 
                 logger.debug(f"Found song: {song_number}. {song_title}")
                 # key = match.group(3)  # We ignore the key for now
@@ -167,14 +188,8 @@ class SetlistParser:
             Dictionary with 'song_title', 'date', and 'spotify_url', or None if invalid.
         """
         try:
-            # Pattern for manual command
             # Flexible to allow "use this for..." or "use this version of ... for..."
-            pattern = re.compile(
-                r'use\s+this(?:\s+version\s+of)?\s+(.+?)\s+for\s+(.+?)\s+(https?://open\.spotify\.com/track/\S+)',
-                re.IGNORECASE
-            )
-
-            match = pattern.search(content)
+            match = self.MANUAL_SONG_PATTERN.search(content)
             if not match:
                 logger.warning("Could not parse manual song command")
                 return None
@@ -292,7 +307,7 @@ class SetlistParser:
         song_start_idx = 0
         for i, line in enumerate(lines):
             stripped = line.strip()
-            if stripped and re.match(r'^\d+[.)]\s+', stripped):
+            if stripped and cls.NUMBERED_LINE_PREFIX_PATTERN.match(stripped):
                 song_start_idx = i
                 break
             elif stripped:
@@ -330,10 +345,8 @@ class SetlistParser:
                         break
 
         # Parse songs from numbered list
-        song_pattern_with_key = re.compile(
-            r'^\s*(\d+)[.)]\s+(.+?)\s+\(([A-Ga-g][#b]?[mM]?(?:aj|in)?)\)\s*(.*)$'
-        )
-        song_pattern_no_key = re.compile(r'^\s*(\d+)[.)]\s+(.+?)\s*$')
+        song_pattern_with_key = cls.ANALYZE_SONG_WITH_KEY_PATTERN
+        song_pattern_no_key = cls.ANALYZE_SONG_NO_KEY_PATTERN
 
         songs_with_keys = 0
         songs_without_keys = 0
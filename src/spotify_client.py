@@ -35,6 +35,8 @@ class SpotifyClient:
 
         # Load Spotify credentials for this guild
         self.credentials = self._get_spotify_credentials()
+        self.token_expires_at = 0  # Unix time the access token used by self.sp expires
+        self.access_token = None  # Access token used by self.sp, compared against stored tokens
 
         try:
             self.sp = self._authenticate()
@@ -233,6 +235,8 @@ class SpotifyClient:
             # Create Spotify client using access token directly
             # This avoids auth_manager trying to do interactive auth in headless environments
             sp = spotipy.Spotify(auth=token_info['access_token'], requests_timeout=10)
+            self.token_expires_at = token_info['expires_at']
+            self.access_token = token_info['access_token']
             logger.info("Spotify authentication successful")
             return sp
 
@@ -246,6 +250,14 @@ class SpotifyClient:
                 "Run: python scripts/setup_spotify_auth.py"
             )
 
+    def is_session_valid(self) -> bool:
+        """Check whether the client is authenticated with an unexpired access token.
+
+        Returns:
+            True if the client can still be used for API calls.
+        """
+        return self.sp is not None and time.time() < self.token_expires_at - 60
+
     def _get_user_id(self) -> str:
         """Get the authenticated user's Spotify ID.
 
@@ -265,12 +265,14 @@ def mock_database():
 
     # Song methods
     db.get_song_by_title = MagicMock(return_value=None)
+    db.get_songs_by_titles = MagicMock(return_value={})
     db.add_or_update_song = MagicMock(return_value=1)
 
     # Setlist methods
     db.create_setlist = MagicMock(return_value=1)
     db.update_setlist_playlist = MagicMock()
     db.add_setlist_song = MagicMock()
+    db.bulk_add_setlist_songs = MagicMock(return_value={})
     db.get_setlist_by_date = MagicMock(return_value=None)
     db.get_setlist_songs = MagicMock(return_value=[])
 
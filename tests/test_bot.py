@@ -136,6 +136,134 @@ class TestParserCaching:
             bot.invalidate_parser_cache(123456789)
             assert 123456789 not in bot._guild_parsers
 
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_default_parser_lookup_is_cached(self, mock_parser_class, mock_commands, mock_db):
+        """Should not re-query patterns for guilds using the default parser."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_setlist_patterns.return_value = {
+            'intro_pattern': None,
+            'song_pattern': None
+        }
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            bot.get_parser_for_guild(123456789)
+            parser = bot.get_parser_for_guild(123456789)
+
+            assert parser == bot._default_parser
+            mock_db_instance.get_setlist_patterns.assert_called_once_with(123456789)
+
+
+class TestJamLeaderCache:
+    """Test cached jam leader checks."""
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_reads_cached_guild_config(self, mock_parser_class, mock_commands, mock_db):
+        """Should read jam leaders from the guild config cache until it is invalidated."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'jam_leader_ids': [42]}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            assert bot.is_jam_leader(1, 42) is True
+            assert bot.is_jam_leader(1, 7) is False
+            assert mock_db_instance.get_bot_configuration.call_count == 1
+            mock_db_instance.is_jam_leader.assert_not_called()
+
+            mock_db_instance.get_bot_configuration.return_value = {'jam_leader_ids': []}
+            bot.invalidate_guild_config_cache(1)
+
+            assert bot.is_jam_leader(1, 42) is False
+            assert mock_db_instance.get_bot_configuration.call_count == 2
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_unconfigured_guild_has_no_leaders(self, mock_parser_class, mock_commands, mock_db):
+        """Should treat a guild without configuration as having no jam leaders."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = None
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            assert bot.is_jam_leader(1, 42) is False
+
+
+class TestGuildConfigCache:
+    """Test cached guild configuration lookups."""
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_caches_config_until_invalidated(self, mock_parser_class, mock_commands, mock_db):
+        """Should read the configuration once until the guild cache is invalidated."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'approver_ids': [1]}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            assert bot.get_guild_config(1) == {'approver_ids': [1]}
+            bot.get_guild_config(1)
+            assert mock_db_instance.get_bot_configuration.call_count == 1
+
+            bot.invalidate_guild_config_cache(1)
+            bot.get_guild_config(1)
+            assert mock_db_instance.get_bot_configuration.call_count == 2
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_premium_check_uses_cached_config(self, mock_parser_class, mock_commands, mock_db):
+        """Should derive premium status from the cached config, requiring flag and token."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.side_effect = lambda guild_id: {
+            1: {'premium_enabled': True, 'premium_api_token': 'jbp_test'},
+            2: {'premium_enabled': True, 'premium_api_token': None},
+        }.get(guild_id)
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            assert bot.is_premium_enabled(1) is True
+            assert bot.is_premium_enabled(1) is True
+            assert bot.is_premium_enabled(2) is False
+            assert bot.is_premium_enabled(3) is False
+            assert mock_db_instance.get_bot_configuration.call_count == 3
+            mock_db_instance.is_premium_enabled.assert_not_called()
+
+            # Premium writes through the database drop the cached config
+            mock_db_instance.on_premium_change(1)
+            assert bot.is_premium_enabled(1) is True
+            assert mock_db_instance.get_bot_configuration.call_count == 4
+
 
 class TestWorkflowCleanup:
     """Test workflow cleanup functionality."""
@@ -169,6 +297,49 @@ class TestWorkflowCleanup:
                 sample_workflow['summary_message_id']
             )
 
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_register_workflow(self, mock_parser, mock_commands, mock_db, sample_workflow):
+        """Should index one shared workflow under every song and summary message ID."""
+        from src.bot import JamBot
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            bot.register_workflow(sample_workflow)
+
+            msg_ids = sample_workflow['message_ids'] + [sample_workflow['summary_message_id']]
+            assert set(bot.active_workflows) == set(msg_ids)
+            assert all(bot.active_workflows[msg_id] is sample_workflow for msg_id in msg_ids)
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_cleanup_workflows_bulk(self, mock_parser, mock_commands, mock_db, sample_workflow):
+        """Should drop every batch workflow in one pass and leave others registered."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            other = dict(sample_workflow, message_ids=[501, 502], summary_message_id=503)
+            kept = dict(sample_workflow, message_ids=[601], summary_message_id=602)
+            for workflow in (sample_workflow, other, kept):
+                bot.register_workflow(workflow)
+
+            bot.cleanup_workflows([sample_workflow, other])
+
+            assert set(bot.active_workflows) == {601, 602}
+            mock_db_instance.delete_workflows.assert_called_once_with(
+                [sample_workflow['summary_message_id'], 503]
+            )
+
 
 class TestMessageHandling:
     """Test message handling."""
@@ -202,7 +373,9 @@ class TestMessageHandling:
         from src.bot import JamBot
 
         mock_db_instance = MagicMock()
-        mock_db_instance.is_jam_leader.return_value = True
+        mock_db_instance.get_bot_configuration.return_value = {
+            'jam_leader_ids': [mock_discord_message.author.id]
+        }
         mock_db_instance.get_setlist_patterns.return_value = {
             'intro_pattern': None,
             'song_pattern': None
@@ -237,6 +410,145 @@ class TestMessageHandling:
 
                 bot.handle_setlist_message.assert_called_once_with(mock_discord_message)
 
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_skips_parser_for_non_leader(
+        self, mock_parser_class, mock_commands, mock_db, mock_discord_message
+    ):
+        """Should not build a parser or run setlist detection for non-leaders."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'jam_leader_ids': []}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            bot.process_commands = AsyncMock()
+            bot.handle_setlist_message = AsyncMock()
+            bot.get_parser_for_guild = MagicMock()
+            bot._fallback_jam_leader_id = None
+            mock_discord_message.role_mentions = []
+
+            mock_user = MagicMock()
+            mock_user.id = 999999999
+            mock_user.mentioned_in.return_value = False
+            with patch.object(type(bot), 'user', new_callable=lambda: property(lambda self: mock_user)):
+                await bot.on_message(mock_discord_message)
+
+                bot.get_parser_for_guild.assert_not_called()
+                bot.handle_setlist_message.assert_not_called()
+                bot.process_commands.assert_called_once_with(mock_discord_message)
+
+
+class TestSpotifyClientCache:
+    """Test per-guild Spotify client caching."""
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    @patch('src.bot.SpotifyClient')
+    def test_reuses_valid_client(self, mock_spotify_class, mock_parser, mock_commands, mock_db):
+        """Should build one client per guild while its session is valid."""
+        from src.bot import JamBot
+
+        mock_spotify_class.return_value.is_session_valid.return_value = True
+        mock_spotify_class.return_value.access_token = 'stored-token'
+        mock_db.return_value.get_spotify_access_token.return_value = 'stored-token'
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            first = bot.get_spotify_for_guild(123)
+            second = bot.get_spotify_for_guild(123)
+
+            assert first is second
+            mock_spotify_class.assert_called_once_with(db=bot.db, guild_id=123)
+
+            bot.invalidate_spotify_cache(123)
+            bot.get_spotify_for_guild(123)
+
+            assert mock_spotify_class.call_count == 2
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    @patch('src.bot.SpotifyClient')
+    def test_rebuilds_expired_or_failed_client(self, mock_spotify_class, mock_parser, mock_commands, mock_db):
+        """Should not reuse a client whose token expired or that failed to authenticate."""
+        from src.bot import JamBot
+
+        expired = MagicMock()
+        expired.is_session_valid.return_value = False
+        failed = MagicMock(sp=None)
+        mock_spotify_class.side_effect = [expired, failed, MagicMock()]
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            assert bot.get_spotify_for_guild(123) is expired
+            assert bot.get_spotify_for_guild(123) is failed
+            assert 123 not in bot._spotify_clients
+            bot.get_spotify_for_guild(123)
+
+            assert mock_spotify_class.call_count == 3
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    @patch('src.bot.SpotifyClient')
+    def test_rebuilds_client_after_reauthorization(
+        self, mock_spotify_class, mock_parser, mock_commands, mock_db
+    ):
+        """Should drop a cached client once the stored tokens were replaced."""
+        from src.bot import JamBot
+
+        stale = MagicMock(access_token='old-token')
+        stale.is_session_valid.return_value = True
+        fresh = MagicMock(access_token='new-token')
+        mock_spotify_class.side_effect = [stale, fresh]
+        mock_db.return_value.get_spotify_access_token.return_value = 'old-token'
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            assert bot.get_spotify_for_guild(123) is stale
+            assert bot.get_spotify_for_guild(123) is stale
+
+            # Web OAuth callback stores new tokens for the guild
+            mock_db.return_value.get_spotify_access_token.return_value = 'new-token'
+            assert bot.get_spotify_for_guild(123) is fresh
+            assert bot._spotify_clients[123] is fresh
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_run_spotify_uses_shared_executor(self, mock_parser, mock_commands, mock_db):
+        """Should run blocking Spotify calls on the bot's Spotify thread pool."""
+        import threading
+        from src.bot import JamBot
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            def blocking_call(value, suffix=''):
+                return threading.current_thread().name, value + suffix
+
+            thread_name, result = await bot._run_spotify(blocking_call, 'track', suffix='-1')
+
+            assert thread_name.startswith('spotify')
+            assert result == 'track-1'
+            bot._spotify_executor.shutdown()
+
 
 class TestDMHandling:
     """Test DM message handling for manual song selection."""
@@ -287,6 +599,183 @@ class TestDMHandling:
                 call_args = mock_discord_message.reply.call_args
                 assert 'Manual selection confirmed' in str(call_args)
 
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    @patch('src.bot.SpotifyClient')
+    async def test_manual_url_updates_replied_song(
+        self, mock_spotify_class, mock_parser, mock_commands, mock_db,
+        mock_discord_message, sample_spotify_track, sample_workflow
+    ):
+        """Should apply the manual selection to the song whose message was replied to."""
+        from src.bot import JamBot
+
+        mock_db.return_value = MagicMock()
+        mock_spotify_class.return_value.get_track_from_url.return_value = sample_spotify_track
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            mock_discord_message.guild = None
+            mock_discord_message.reference = MagicMock()
+            mock_discord_message.reference.message_id = sample_workflow['message_ids'][1]
+            mock_discord_message.content = 'Try this one <https://open.spotify.com/track/abc123>'
+            mock_discord_message.reply = AsyncMock()
+
+            for msg_id in sample_workflow['message_ids']:
+                bot.active_workflows[msg_id] = sample_workflow
+
+            await bot.handle_dm_message(mock_discord_message)
+
+            mock_spotify_class.return_value.get_track_from_url.assert_called_once_with(
+                'https://open.spotify.com/track/abc123'
+            )
+            song_number = sample_workflow['song_matches'][1]['number']
+            assert sample_workflow['selections'][str(song_number)] == sample_spotify_track
+            assert mock_db.return_value.add_or_update_song.call_args.kwargs['song_title'] == \
+                sample_workflow['song_matches'][1]['title']
+
+
+class TestSongMatching:
+    """Test song matching against the database and Spotify."""
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    @patch('src.bot.SpotifyClient')
+    async def test_find_song_matches_preserves_order(
+        self, mock_spotify_class, mock_parser, mock_commands, mock_db, sample_spotify_track
+    ):
+        """Should use stored versions when available and search Spotify otherwise."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_songs_by_titles.return_value = {
+            'Blue Moon of Kentucky': {
+                'spotify_track_id': 'track789',
+                'spotify_track_name': 'Blue Moon of Kentucky',
+                'artist': 'Bill Monroe',
+                'album': 'Best Of',
+                'spotify_url': 'https://open.spotify.com/track/track789',
+            },
+        }
+        mock_db.return_value = mock_db_instance
+
+        mock_spotify_instance = MagicMock()
+        mock_spotify_instance.search_song.return_value = [sample_spotify_track]
+        mock_spotify_class.return_value = mock_spotify_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            songs = [
+                {'number': 1, 'title': 'Will the Circle Be Unbroken'},
+                {'number': 2, 'title': 'Blue Moon of Kentucky'},
+                {'number': 3, 'title': 'Rocky Top'},
+            ]
+            matches = await bot.find_song_matches(songs, 123456789)
+
+            assert [m['number'] for m in matches] == [1, 2, 3]
+            assert matches[0]['spotify_results'] == [sample_spotify_track]
+            assert matches[1]['stored_version']['uri'] == 'spotify:track:track789'
+            assert matches[1]['spotify_results'] == []
+            assert mock_spotify_instance.search_song.call_count == 2
+            mock_db_instance.get_songs_by_titles.assert_called_once_with(
+                123456789, [song['title'] for song in songs]
+            )
+
+
+class TestReactionHandling:
+    """Test reaction handling for song selection."""
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_select_reaction_on_restored_workflow(
+        self, mock_parser, mock_commands, mock_db, sample_workflow
+    ):
+        """Should map the reacted message to its song for workflows loaded from the database."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+            bot._get_dm_channel = AsyncMock(return_value=MagicMock(send=AsyncMock()))
+
+            for msg_id in sample_workflow['message_ids'] + [sample_workflow['summary_message_id']]:
+                bot.active_workflows[msg_id] = sample_workflow
+
+            payload = MagicMock()
+            payload.user_id = 333333333
+            payload.message_id = sample_workflow['message_ids'][0]
+            payload.emoji = bot.SELECT_EMOJIS[0]
+
+            mock_user = MagicMock()
+            mock_user.id = 999999999
+            with patch.object(type(bot), 'user', new_callable=lambda: property(lambda self: mock_user)):
+                await bot.on_raw_reaction_add(payload)
+
+            first_match = sample_workflow['song_matches'][0]
+            assert sample_workflow['selections']['1'] == first_match['spotify_results'][0]
+            mock_db_instance.update_workflow_selection.assert_called_once_with(
+                sample_workflow['summary_message_id'], 1, first_match['spotify_results'][0]
+            )
+
+
+class TestPlaylistCreation:
+    """Test playlist creation from an approved workflow."""
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    @patch('src.bot.SpotifyClient')
+    async def test_create_playlist_from_workflow(
+        self, mock_spotify_class, mock_parser, mock_commands, mock_db,
+        mock_spotify_client, sample_workflow, sample_spotify_track
+    ):
+        """Should store setlist songs in one batch and create the playlist in order."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = None
+        mock_db_instance.create_setlist.return_value = 5
+        mock_db.return_value = mock_db_instance
+        mock_spotify_class.return_value = mock_spotify_client
+
+        sample_workflow['selections']['1'] = sample_spotify_track
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+            bot.notify_admin = AsyncMock()
+
+            channel = MagicMock()
+            channel.guild.id = 123456789
+            channel.send = AsyncMock(return_value=MagicMock(id=42, add_reaction=AsyncMock()))
+            bot.get_channel = MagicMock(return_value=channel)
+
+            await bot.create_playlist_from_workflow(sample_workflow)
+
+            guild_id, setlist_id, songs = mock_db_instance.bulk_add_setlist_songs.call_args[0]
+            assert (guild_id, setlist_id) == (123456789, 5)
+            assert [(s['position'], s['song_title']) for s in songs] == [
+                (1, 'Will the Circle Be Unbroken'),
+                (2, 'Blue Moon of Kentucky'),
+            ]
+            mock_spotify_client.add_tracks_to_playlist.assert_called_once_with(
+                'playlist123', ['spotify:track:track123', 'spotify:track:track789']
+            )
+            mock_db_instance.delete_workflow.assert_called_once_with(sample_workflow['summary_message_id'])
+
 
 class TestEmojiConstants:
     """Test emoji constants are correct."""
@@ -310,11 +799,10 @@ class TestEmojiConstants:
 class TestSongApprovalEmbed:
     """Test song approval embed creation."""
 
-    @pytest.mark.asyncio
     @patch('src.bot.Database')
     @patch('src.bot.JambotCommands')
     @patch('src.bot.SetlistParser')
-    async def test_embed_for_stored_version(self, mock_parser, mock_commands, mock_db):
+    def test_embed_for_stored_version(self, mock_parser, mock_commands, mock_db):
         """Should create green embed for stored version."""
         from src.bot import JamBot
 
@@ -334,16 +822,15 @@ class TestSongApprovalEmbed:
                 'spotify_results': [],
             }
 
-            embed = await bot.create_song_approval_embed(match)
+            embed = bot.create_song_approval_embed(match)
 
             assert embed.color == discord.Color.green()
             assert 'Stored Version' in embed.description
 
-    @pytest.mark.asyncio
     @patch('src.bot.Database')
     @patch('src.bot.JambotCommands')
     @patch('src.bot.SetlistParser')
-    async def test_embed_for_no_matches(self, mock_parser, mock_commands, mock_db):
+    def test_embed_for_no_matches(self, mock_parser, mock_commands, mock_db):
         """Should create red embed when no matches found."""
         from src.bot import JamBot
 
@@ -358,16 +845,15 @@ class TestSongApprovalEmbed:
                 'spotify_results': [],
             }
 
-            embed = await bot.create_song_approval_embed(match)
+            embed = bot.create_song_approval_embed(match)
 
             assert embed.color == discord.Color.red()
             assert 'No matches found' in embed.description
 
-    @pytest.mark.asyncio
     @patch('src.bot.Database')
     @patch('src.bot.JambotCommands')
     @patch('src.bot.SetlistParser')
-    async def test_embed_for_multiple_matches(self, mock_parser, mock_commands, mock_db):
+    def test_embed_for_multiple_matches(self, mock_parser, mock_commands, mock_db):
         """Should create gold embed with options for multiple matches."""
         from src.bot import JamBot
 
@@ -386,8 +872,337 @@ class TestSongApprovalEmbed:
                 ],
             }
 
-            embed = await bot.create_song_approval_embed(match)
+            embed = bot.create_song_approval_embed(match)
 
             assert embed.color == discord.Color.gold()
             assert '3 matches found' in embed.description
             assert len(embed.fields) == 3  # One field per option
+
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    def test_embed_options_limited_to_select_emojis(self, mock_parser, mock_commands, mock_db):
+        """Should only list as many options as there are selection reactions."""
+        from src.bot import JamBot
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            match = {
+                'number': 1,
+                'title': 'Test Song',
+                'stored_version': None,
+                'spotify_results': [
+                    {'name': f'Version {i}', 'artist': 'A', 'album': 'B', 'url': f'url{i}'}
+                    for i in range(5)
+                ],
+            }
+
+            embed = bot.create_song_approval_embed(match)
+
+            assert [f.name for f in embed.fields] == [
+                f"{emoji} Option {i}" for i, emoji in enumerate(bot.SELECT_EMOJIS, 1)
+            ]
+
+
+class TestApprovalWorkflowSending:
+    """Test sending approval workflow DMs."""
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_adds_reactions_per_message(
+        self, mock_parser, mock_commands, mock_db, mock_discord_user, sample_workflow
+    ):
+        """Should add the right reactions to each song message and the summary."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            song_matches = sample_workflow['song_matches'] + [{
+                'number': 3,
+                'title': 'Rocky Top',
+                'stored_version': None,
+                'spotify_results': [
+                    {'name': 'Rocky Top', 'artist': 'A', 'album': 'A', 'url': 'url1'},
+                    {'name': 'Rocky Top', 'artist': 'B', 'album': 'B', 'url': 'url2'},
+                ],
+            }]
+
+            sent_messages = []
+
+            async def send(*args, **kwargs):
+                msg = MagicMock()
+                msg.id = 1000 + len(sent_messages)
+                msg.add_reaction = AsyncMock()
+                sent_messages.append(msg)
+                return msg
+
+            dm_channel = MagicMock()
+            dm_channel.send = AsyncMock(side_effect=send)
+            mock_discord_user.dm_channel = None  # Not cached yet
+            mock_discord_user.create_dm = AsyncMock(return_value=dm_channel)
+            bot.fetch_user = AsyncMock(return_value=mock_discord_user)
+
+            await bot._send_approval_workflow_to_user(
+                mock_discord_user.id,
+                sample_workflow['setlist_data'],
+                song_matches,
+                original_channel_id=555555555,
+                guild_id=123456789,
+            )
+
+            reactions = [
+                [c.args[0] for c in msg.add_reaction.call_args_list] for msg in sent_messages
+            ]
+            assert reactions == [
+                [bot.APPROVE_EMOJI],  # Single Spotify result
+                [bot.APPROVE_EMOJI],  # Stored version
+                bot.SELECT_EMOJIS[:2],  # Multiple results, in order
+                [bot.APPROVE_EMOJI, bot.REJECT_EMOJI],  # Summary
+            ]
+            assert set(bot.active_workflows) == {1000, 1001, 1002, 1003}
+            mock_db_instance.save_workflow.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_reaction_failure_keeps_workflow(
+        self, mock_parser, mock_commands, mock_db, mock_discord_user, sample_workflow
+    ):
+        """Should still register and persist the workflow if a reaction fails."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            sent_messages = []
+
+            async def send(*args, **kwargs):
+                msg = MagicMock()
+                msg.id = 2000 + len(sent_messages)
+                msg.add_reaction = AsyncMock(
+                    side_effect=discord.HTTPException(MagicMock(status=500), 'boom')
+                    if not sent_messages else None
+                )
+                sent_messages.append(msg)
+                return msg
+
+            dm_channel = MagicMock()
+            dm_channel.send = AsyncMock(side_effect=send)
+            mock_discord_user.dm_channel = dm_channel
+            bot.fetch_user = AsyncMock(return_value=mock_discord_user)
+
+            await bot._send_approval_workflow_to_user(
+                mock_discord_user.id,
+                sample_workflow['setlist_data'],
+                sample_workflow['song_matches'],
+                original_channel_id=555555555,
+                guild_id=123456789,
+            )
+
+            assert set(bot.active_workflows) == {2000, 2001, 2002}
+            mock_db_instance.save_workflow.assert_called_once()
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_send_failure_awaits_started_reaction_tasks(
+        self, mock_parser, mock_commands, mock_db, mock_discord_user, sample_workflow
+    ):
+        """Should collect reaction tasks already started when a later DM send fails."""
+        from src.bot import JamBot
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            first_msg = MagicMock(id=2000)
+            dm_channel = MagicMock()
+            dm_channel.send = AsyncMock(side_effect=[
+                first_msg, discord.HTTPException(MagicMock(status=500), 'boom')
+            ])
+            mock_discord_user.dm_channel = dm_channel
+            bot.fetch_user = AsyncMock(return_value=mock_discord_user)
+            bot._add_reactions = AsyncMock(side_effect=RuntimeError('reaction failed'))
+
+            with pytest.raises(discord.HTTPException):
+                await bot._send_approval_workflow_to_user(
+                    mock_discord_user.id,
+                    sample_workflow['setlist_data'],
+                    sample_workflow['song_matches'],
+                    original_channel_id=555555555,
+                    guild_id=123456789,
+                )
+
+            bot._add_reactions.assert_awaited_once()
+            assert bot._add_reactions.await_args[0][0] is first_msg
+            assert bot.active_workflows == {}
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_builds_song_embeds_once_for_all_approvers(
+        self, mock_parser, mock_commands, mock_db, sample_workflow
+    ):
+        """Should build each song embed once and share it across approvers."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'approver_ids': [111, 222]}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+            bot._send_approval_workflow_to_user = AsyncMock()
+
+            with patch.object(bot, 'create_song_approval_embed', wraps=bot.create_song_approval_embed) as build:
+                await bot.send_approval_workflow(
+                    sample_workflow['setlist_data'],
+                    sample_workflow['song_matches'],
+                    original_channel_id=555555555,
+                    guild_id=123456789,
+                )
+
+            assert build.call_count == len(sample_workflow['song_matches'])
+            calls = bot._send_approval_workflow_to_user.call_args_list
+            assert [c.args[0] for c in calls] == [111, 222]
+            assert calls[0].kwargs['song_embeds'] is calls[1].kwargs['song_embeds']
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_approver_failure_does_not_block_others(
+        self, mock_parser, mock_commands, mock_db, sample_workflow
+    ):
+        """Should still send to remaining approvers when one send fails."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'approver_ids': [111, 222]}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+            bot._send_approval_workflow_to_user = AsyncMock(
+                side_effect=[RuntimeError('DMs closed'), None]
+            )
+
+            await bot.send_approval_workflow(
+                sample_workflow['setlist_data'],
+                sample_workflow['song_matches'],
+                original_channel_id=555555555,
+                guild_id=123456789,
+            )
+
+            assert bot._send_approval_workflow_to_user.await_count == 2
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_sends_once_per_unique_recipient(
+        self, mock_parser, mock_commands, mock_db, sample_workflow
+    ):
+        """Should add the triggering user once and never DM the same approver twice."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'approver_ids': [111, 222, 111]}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+            bot._send_approval_workflow_to_user = AsyncMock()
+
+            await bot.send_approval_workflow(
+                sample_workflow['setlist_data'],
+                sample_workflow['song_matches'],
+                original_channel_id=555555555,
+                guild_id=123456789,
+                triggered_by_user_id=333,
+            )
+
+            calls = bot._send_approval_workflow_to_user.call_args_list
+            assert [c.args[0] for c in calls] == [111, 222, 333]
+            assert mock_db_instance.get_bot_configuration.return_value['approver_ids'] == [111, 222, 111]
+
+
+class TestNotifyAdmin:
+    """Test approver notifications."""
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_notifies_remaining_approvers_after_failure(
+        self, mock_parser, mock_commands, mock_db
+    ):
+        """Should DM every approver even if one DM fails."""
+        from src.bot import JamBot
+
+        mock_db_instance = MagicMock()
+        mock_db_instance.get_bot_configuration.return_value = {'approver_ids': [111, 222, 333]}
+        mock_db.return_value = mock_db_instance
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            channels = {uid: MagicMock(send=AsyncMock()) for uid in (111, 333)}
+
+            async def get_dm_channel(user_id):
+                if user_id == 222:
+                    raise RuntimeError('DMs closed')
+                return channels[user_id]
+
+            bot._get_dm_channel = AsyncMock(side_effect=get_dm_channel)
+
+            await bot.notify_admin('Heads up', guild_id=123456789)
+
+            for channel in channels.values():
+                channel.send.assert_awaited_once_with('Heads up')
+
+            # A second notification reuses the cached approver list
+            await bot.notify_admin('Again', guild_id=123456789)
+            mock_db_instance.get_bot_configuration.assert_called_once_with(123456789)
+
+    @pytest.mark.asyncio
+    @patch('src.bot.Database')
+    @patch('src.bot.JambotCommands')
+    @patch('src.bot.SetlistParser')
+    async def test_dm_token_bucket_paces_bursts(self, mock_parser, mock_commands, mock_db):
+        """Should allow a burst of NOTIFY_RATE DMs, then wait for tokens to refill."""
+        from src.bot import JamBot
+
+        with patch.object(JamBot, 'cleanup_expired_workflows') as mock_task:
+            mock_task.start = MagicMock()
+            bot = JamBot()
+
+            with patch('src.bot.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+                for _ in range(int(bot.NOTIFY_RATE)):
+                    await bot._acquire_dm_token()
+                mock_sleep.assert_not_called()
+
+                await bot._acquire_dm_token()
+                mock_sleep.assert_awaited_once()
+                delay = mock_sleep.await_args[0][0]
+                assert delay == pytest.approx(1 / bot.NOTIFY_RATE, abs=0.05)
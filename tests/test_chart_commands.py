@@ -258,3 +258,280 @@ async def test_create_request_not_rate_limited(mock_bot, mock_db, mock_rate_limi
 
         # Create requests should NOT check rate limit
         mock_rate_limiter.check_rate_limit.assert_not_called()
+
+
+def test_parse_chord_input_local_flattens_measures():
+    """Test that measure bars and line breaks are both treated as chord separators."""
+    from src.chart_commands import parse_chord_input_local
+
+    chart = parse_chord_input_local(
+        'Mountain Dew', 'G', 'Verse,Chorus',
+        'G | G C | G\nD  D | G\n\nC C | G G',
+        'Line one\nLine two\n\nChorus line',
+    )
+
+    assert chart['sections'][0]['chords'] == ['G', 'G', 'C', 'G', 'D', 'D', 'G']
+    assert chart['sections'][1] == {'label': 'Chorus', 'chords': ['C', 'C', 'G', 'G'], 'rows': 4}
+    assert chart['lyrics'] == [
+        {'label': 'Verse', 'lines': ['Line one', 'Line two']},
+        {'label': 'Chorus', 'lines': ['Chorus line']},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('content, expected_title', [
+    ('@jambot create a chord chart', None),
+    ('@jambot add a chord chart for "Mountain Dew" in A', 'Mountain Dew'),
+    ('@jambot I need a chart for Mountain Dew. Actually, make a new chart for Salty Dog', 'Salty Dog'),
+])
+async def test_create_mention_prefills_title(mock_bot, mock_db, content, expected_title):
+    """Test that create phrasing is recognized and wins over lookup phrasing."""
+    mock_message = AsyncMock()
+    mock_message.content = content
+    mock_message.reply = AsyncMock()
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+
+    with patch('src.chart_commands.CreateChartView') as mock_view:
+        await chart_commands.handle_mention(mock_message)
+
+        mock_view.assert_called_once_with(
+            mock_db, prefill_title=expected_title, bot=mock_bot,
+            on_chart_saved=chart_commands.invalidate_chart_cache,
+        )
+        mock_db.get_chord_chart.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_lookup_mention_extracts_title_and_key(mock_bot, mock_db):
+    """Test that a lookup mention splits the requested key from the title."""
+    mock_message = AsyncMock()
+    mock_message.content = '<@123> chord chart for Mountain Dew in A'
+    mock_message.guild.id = 789012
+    mock_message.reply = AsyncMock()
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+
+    await chart_commands.handle_mention(mock_message)
+
+    mock_db.get_chord_chart.assert_called_once_with(789012, 'Mountain Dew')
+
+
+@pytest.mark.asyncio
+async def test_render_pdf_reuses_identical_chart(mock_bot, mock_db):
+    """Test that identical chart content is rendered once and evicted LRU-first."""
+    chart_commands = ChartCommands(mock_bot, mock_db)
+    chart_commands.PDF_CACHE_SIZE = 2
+    chart_g = {'title': 'Mountain Dew', 'key': 'G', 'sections': [], 'lyrics': None}
+    chart_a = dict(chart_g, key='A')
+    chart_d = dict(chart_g, key='D')
+
+    with patch('src.chart_commands.render_chart_pdf_via_api', new_callable=AsyncMock) as mock_render:
+        mock_render.side_effect = lambda db, guild_id, data: f"%PDF-{data['key']}".encode()
+
+        assert await chart_commands._render_pdf(789012, chart_g) == b'%PDF-G'
+        assert await chart_commands._render_pdf(789012, dict(chart_g)) == b'%PDF-G'
+        assert mock_render.call_count == 1
+
+        await chart_commands._render_pdf(789012, chart_a)
+        await chart_commands._render_pdf(789012, chart_g)
+        await chart_commands._render_pdf(789012, chart_d)  # Evicts A, not the recently used G
+        await chart_commands._render_pdf(789012, chart_g)
+        assert mock_render.call_count == 3
+
+        await chart_commands._render_pdf(789012, chart_a)
+        assert mock_render.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_render_pdf_cache_hit_requires_premium(mock_bot, mock_db):
+    """Test that a cached PDF is not served once the guild loses premium."""
+    from src.chart_commands import InvalidTokenError
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+    chart = {'title': 'Mountain Dew', 'key': 'G', 'sections': [], 'lyrics': None}
+
+    with patch('src.chart_commands.render_chart_pdf_via_api', new_callable=AsyncMock) as mock_render:
+        mock_render.return_value = b'%PDF-G'
+        await chart_commands._render_pdf(789012, chart)
+
+        mock_bot.is_premium_enabled.return_value = False
+        with pytest.raises(InvalidTokenError):
+            await chart_commands._render_pdf(789012, chart)
+
+        mock_bot.is_premium_enabled.assert_called_with(789012)
+        assert mock_render.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_mention_without_chart_keyword_is_ignored(mock_bot, mock_db, mock_rate_limiter):
+    """Test that ordinary mentions return before any lookup or rate limiting."""
+    mock_message = AsyncMock()
+    mock_message.content = '<@123> thanks for the setlist!'
+    mock_message.reply = AsyncMock()
+
+    chart_commands = ChartCommands(mock_bot, mock_db, rate_limiter=mock_rate_limiter)
+
+    with patch('src.chart_commands._CHART_REQUEST') as mock_pattern:
+        await chart_commands.handle_mention(mock_message)
+
+        mock_pattern.match.assert_not_called()
+    mock_rate_limiter.check_rate_limit.assert_not_called()
+    mock_message.reply.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_create_chart_view_disables_button_on_timeout(mock_db):
+    """Test that an expired create view disables its button on the sent message."""
+    from src.chart_commands import CreateChartView
+
+    view = CreateChartView(mock_db, prefill_title='Mountain Dew')
+    view.message = AsyncMock()
+
+    await view.on_timeout()
+
+    assert all(child.disabled for child in view.children)
+    view.message.edit.assert_awaited_once_with(view=view)
+
+
+@pytest.mark.asyncio
+async def test_list_truncates_long_chart_list(mock_bot, mock_db, mock_interaction):
+    """Test that a long chart list is cut at the Discord message limit."""
+    mock_db.list_chord_charts = MagicMock(return_value=[
+        {'title': f'Song {i}', 'keys': [{'key': 'G'}, {'key': 'A'}], 'created_by': 42}
+        for i in range(500)
+    ])
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+    await chart_commands._handle_list(mock_interaction)
+
+    msg = mock_interaction.followup.send.call_args[0][0]
+    assert msg.startswith("**Chord Charts:**\n- **Song 0** (Key of G, A) — by <@42>\n")
+    assert msg.endswith("\n...")
+    assert len(msg) == 1904
+
+
+@pytest.mark.asyncio
+async def test_transpose_existing_key_is_case_insensitive(mock_bot, mock_db, mock_interaction):
+    """Test that transposing to a key the chart already has (any case) is refused."""
+    mock_db.get_chord_chart.return_value = {
+        'id': 1,
+        'title': 'Mountain Dew',
+        'keys': [{'key': 'G', 'sections': []}],
+    }
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+
+    with patch('src.chart_commands.transpose_chart_via_api', new_callable=AsyncMock) as mock_transpose:
+        await chart_commands._handle_transpose(mock_interaction, 'Mountain Dew', 'g')
+
+        mock_transpose.assert_not_called()
+    assert 'already has a Key of g' in mock_interaction.followup.send.call_args[0][0]
+
+
+@pytest.mark.asyncio
+async def test_view_sanitizes_pdf_filename(mock_bot, mock_db, mock_interaction):
+    """Test that path separators in a title don't leak into the PDF filename."""
+    mock_db.get_chord_chart.return_value = {
+        'id': 1,
+        'title': 'AC/DC: Back In Black',
+        'keys': [{'key': 'E', 'sections': []}],
+    }
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+
+    with patch('src.chart_commands.render_chart_pdf_via_api', new_callable=AsyncMock) as mock_render:
+        mock_render.return_value = b'%PDF-mock'
+        await chart_commands._handle_view(mock_interaction, 'AC/DC: Back In Black', None)
+
+    sent_file = mock_interaction.followup.send.call_args[1]['file']
+    assert sent_file.filename == 'AC_DC__Back_In_Black_E.pdf'
+
+
+@pytest.mark.asyncio
+async def test_find_chart_caches_lookups_until_invalidated(mock_bot, mock_db):
+    """Test that repeated lookups, including misses, reuse the cached result."""
+    mock_db.search_chord_charts.return_value = [{'id': 2, 'title': 'Mountain Dew'}]
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+
+    assert (await chart_commands._find_chart(789012, 'mountain'))['id'] == 2
+    assert await chart_commands._find_chart(789012, 'mountain') is not None
+    mock_db.get_chord_chart.assert_called_once_with(789012, 'mountain')
+    mock_db.search_chord_charts.assert_called_once_with(789012, 'mountain')
+
+    mock_db.search_chord_charts.return_value = []
+    chart_commands.invalidate_chart_cache(789012)
+
+    assert await chart_commands._find_chart(789012, 'mountain') is None
+    assert await chart_commands._find_chart(789012, 'mountain') is None
+    assert mock_db.search_chord_charts.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_find_chart_cache_stays_within_limit(mock_bot, mock_db):
+    """Test that arbitrary requested titles cannot grow the lookup cache unbounded."""
+    mock_db.get_chord_chart.return_value = None
+    mock_db.search_chord_charts.return_value = []
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+    chart_commands.CHART_LOOKUP_CACHE_SIZE = 3
+
+    for title in ['one', 'two', 'three']:
+        await chart_commands._find_chart(789012, title)
+    await chart_commands._find_chart(789012, 'one')
+    await chart_commands._find_chart(789012, 'four')
+
+    assert len(chart_commands._chart_cache) == 3
+    assert (789012, 'two') not in chart_commands._chart_cache
+    assert (789012, 'one') in chart_commands._chart_cache
+
+
+@pytest.mark.asyncio
+async def test_create_modal_saves_chart_off_event_loop(mock_db, mock_interaction):
+    """Test that the create modal writes the chart from a worker thread."""
+    import threading
+    from src.chart_commands import ChartCreateModal
+
+    save_threads = []
+    mock_db.create_chord_chart = MagicMock(
+        side_effect=lambda **kwargs: save_threads.append(threading.current_thread())
+    )
+
+    modal = ChartCreateModal(mock_db, prefill_title='Mountain Dew')
+    for field, value in (
+        (modal.song_title, 'Mountain Dew'), (modal.key, 'G'),
+        (modal.section_labels, 'Verse'), (modal.chords, 'G G C G'), (modal.lyrics, ''),
+    ):
+        field._value = value
+
+    with patch('src.chart_commands.render_chart_pdf_via_api', new_callable=AsyncMock) as mock_render:
+        mock_render.return_value = b'%PDF-mock'
+        await modal.on_submit(mock_interaction)
+
+    assert len(save_threads) == 1
+    assert save_threads[0] is not threading.main_thread()
+
+
+@pytest.mark.asyncio
+async def test_modal_created_chart_clears_cached_miss(mock_bot, mock_db, mock_interaction):
+    """Test that a chart saved from the create modal is found right after a cached miss."""
+    from src.chart_commands import ChartCreateModal
+
+    chart_commands = ChartCommands(mock_bot, mock_db)
+    assert await chart_commands._find_chart(mock_interaction.guild_id, 'Mountain Dew') is None
+
+    modal = ChartCreateModal(mock_db, on_chart_saved=chart_commands.invalidate_chart_cache)
+    for field, value in (
+        (modal.song_title, 'Mountain Dew'), (modal.key, 'G'),
+        (modal.section_labels, 'Verse'), (modal.chords, 'G G C G'), (modal.lyrics, ''),
+    ):
+        field._value = value
+
+    with patch('src.chart_commands.render_chart_pdf_via_api', new_callable=AsyncMock) as mock_render:
+        mock_render.return_value = b'%PDF-mock'
+        await modal.on_submit(mock_interaction)
+
+    mock_db.get_chord_chart.return_value = {'id': 1, 'title': 'Mountain Dew'}
+    chart = await chart_commands._find_chart(mock_interaction.guild_id, 'Mountain Dew')
+    assert chart['id'] == 1
@@ -100,6 +100,17 @@ class TestSetlistParserParsing:
             assert '(' not in song['title']
             assert ')' not in song['title']
 
+    def test_parse_reuses_intro_match_from_detection(self, sample_setlist_message):
+        """Parsing a message that was just detected should not rescan the intro."""
+        parser = SetlistParser()
+        assert parser.is_setlist_message(sample_setlist_message) is True
+        result = parser.parse_setlist(sample_setlist_message)
+
+        assert result is not None
+        info = parser._search_intro.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     def test_returns_none_for_invalid_message(self):
         """Should return None for messages that aren't setlists."""
         parser = SetlistParser()
@@ -69,6 +69,23 @@ class TestSpotifyClientInitialization:
         client = SpotifyClient(db=mock_db, guild_id=123456789)
 
         assert client.user_id == 'test_user'
+        assert client.is_session_valid() is True
+        assert client.access_token == 'valid-access-token'
+
+    def test_session_invalid_near_token_expiry(self):
+        """Should report an expiring or unauthenticated client as unusable."""
+        from src.spotify_client import SpotifyClient
+
+        client = SpotifyClient.__new__(SpotifyClient)
+        client.sp = MagicMock()
+        client.token_expires_at = int(time.time()) + 30  # Inside the refresh margin
+
+        assert client.is_session_valid() is False
+
+        client.sp = None
+        client.token_expires_at = int(time.time()) + 3600
+
+        assert client.is_session_valid() is False
 
 
 class TestSpotifyCredentials: